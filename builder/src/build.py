@@ -18,15 +18,14 @@ from . import supervisor_downloader as supervisor
 from .logger import BuildLogger, get_logger
 from .resources import get_templates_dir
 from .version import DEFAULT_VERSION, determine_build_versions
+from .yaml_utils import load_yaml
 
 logger: BuildLogger = get_logger(__name__)
 
 # Default versions
 DEFAULT_OTEL_CONTRIB_VERSION = DEFAULT_VERSION  # Default OpenTelemetry Contrib version to use if not detected from manifest
-MIN_SUPERVISOR_VERSION = "0.122.0"  # Minimum required version for the supervisor
 DEFAULT_GO_VERSION = "1.24.0"  # Default Go version (must match Dockerfile GO_VERSIONS / DEFAULT_GO_VERSION)
 
-CONTRIB_PREFIX = "github.com/open-telemetry/opentelemetry-collector-contrib/"
 EXCLUDED_FILES = ["artifacts.json", "metadata.json", "config.yaml"]
 
 
@@ -170,7 +169,7 @@ class BuildContext:
         platform_pairs = platform_pairs or [(o, a) for o in goos for a in goarch]
 
         # Parse manifest
-        manifest = yaml.safe_load(manifest_content)
+        manifest = load_yaml(manifest_content)
 
         # Extract required fields
         distribution = manifest["dist"]["name"]
@@ -502,7 +501,7 @@ def process_goreleaser_yaml(
     for the exact platforms the user asked for.
     """
     needs_rewrite = False
-    config = yaml.safe_load(content)
+    config = load_yaml(content)
 
     # Add ignore entries for unwanted cross-product combinations
     pairs_set = set(platform_pairs)
@@ -632,9 +631,9 @@ def build_release(ctx: BuildContext, go_env: Optional[dict[str, str]] = None) ->
     # Always show goreleaser output
     if result.stdout:
         logger.info("Goreleaser Output:", indent=1)
-        for line in result.stdout.splitlines():
-            if line.strip():  # Skip empty lines
-                logger.info(line, indent=2)
+        # Log the output as a single record rather than one call per line
+        lines = [line for line in result.stdout.splitlines() if line.strip()]
+        logger.info("\n".join(lines), indent=2)
 
     if result.returncode != 0:
         logger.error("Goreleaser build failed")
@@ -0,0 +1,9 @@
+"""Shared helpers for supporting older Python versions."""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+# Use as @dataclass(**DATACLASS_SLOTS).
+DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
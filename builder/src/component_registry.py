@@ -3,16 +3,15 @@
 from dataclasses import dataclass
 from typing import Optional
 
-import yaml
-
 from .logger import BuildLogger, get_logger
 from .resources import get_components_yaml_path
 from .version import DEFAULT_VERSION
+from .yaml_utils import load_yaml
 
 logger: BuildLogger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ComponentInfo:
     """Information about an OpenTelemetry Collector component."""
 
@@ -44,12 +43,20 @@ class ComponentRegistry:
             "providers": {},
         }
 
+        # Versioned lookups are pure, so identical calls share one result
+        self._lookup_cache: dict[
+            tuple[str, str, str, Optional[str]], Optional[ComponentInfo]
+        ] = {}
+
+        # (lowercase name, name) pairs per type, precomputed for find_similar
+        self._lowercase_names: dict[str, list[tuple[str, str]]] = {}
+
         self._load_components(components_file)
 
     def _load_components(self, components_file: str) -> None:
         """Load components from YAML file."""
         with open(components_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         for component_type, components_dict in self._components.items():
             if component_type in data:
@@ -61,6 +68,11 @@ class ComponentRegistry:
                         component_type=component_type,
                     )
 
+        self._lowercase_names = {
+            component_type: [(name.lower(), name) for name in components_dict]
+            for component_type, components_dict in self._components.items()
+        }
+
     def lookup(
         self,
         component_type: str,
@@ -80,28 +92,64 @@ class ComponentRegistry:
         Returns:
             ComponentInfo if found, None otherwise
         """
+        return self.lookup_many(component_type, [name], version, core_version)[0]
+
+    def lookup_many(
+        self,
+        component_type: str,
+        names: list[str],
+        version: str = DEFAULT_VERSION,
+        core_version: Optional[str] = None,
+    ) -> list[Optional[ComponentInfo]]:
+        """Look up several components of the same type in one pass.
+
+        Args:
+            component_type: Type of component (receivers, processors, etc.)
+            names: Names of the components as used in config
+            version: Version to use for contrib gomod entries (__VERSION__)
+            core_version: Version to use for core gomod entries (__CORE_VERSION__).
+                         Defaults to version if not provided.
+
+        Returns:
+            A ComponentInfo (or None if not found) for each name, in order
+        """
         # Normalize component type to plural form
         if not component_type.endswith("s"):
             component_type = component_type + "s"
 
-        # Handle named instances (e.g., "otlp/traces" -> "otlp")
-        base_name = name.split("/")[0]
+        table = self._components.get(component_type, {})
+        cache = self._lookup_cache
+        resolved_core_version = core_version or version
+        results: list[Optional[ComponentInfo]] = []
+
+        for name in names:
+            # Handle named instances (e.g., "otlp/traces" -> "otlp")
+            base_name = name.partition("/")[0]
+
+            key = (component_type, base_name, version, core_version)
+            if key in cache:
+                results.append(cache[key])
+                continue
 
-        component = self._components.get(component_type, {}).get(base_name)
+            result = None
+            component = table.get(base_name)
 
-        if component:
-            # Create a new ComponentInfo with the versioned gomod
-            versioned_gomod = self._apply_version(
-                component.gomod, version, core_version or version
-            )
-            return ComponentInfo(
-                name=component.name,
-                gomod=versioned_gomod,
-                source=component.source,
-                component_type=component.component_type,
-            )
+            if component:
+                # Create a new ComponentInfo with the versioned gomod
+                versioned_gomod = self._apply_version(
+                    component.gomod, version, resolved_core_version
+                )
+                result = ComponentInfo(
+                    name=component.name,
+                    gomod=versioned_gomod,
+                    source=component.source,
+                    component_type=component.component_type,
+                )
 
-        return None
+            cache[key] = result
+            results.append(result)
+
+        return results
 
     def _apply_version(self, gomod: str, version: str, core_version: str) -> str:
         """Apply version to a gomod string.
@@ -149,19 +197,21 @@ class ComponentRegistry:
         if not component_type.endswith("s"):
             component_type = component_type + "s"
 
-        all_names = list(self._components.get(component_type, {}).keys())
-
         # Simple similarity based on common prefix/suffix
         suggestions = []
         name_lower = name.lower()
+        name_len = len(name_lower)
 
-        for candidate in all_names:
-            candidate_lower = candidate.lower()
-            # Check for partial matches
+        for candidate_lower, candidate in self._lowercase_names.get(component_type, []):
+            # Check for partial matches. The length difference is a lower bound
+            # on the edit distance, so skip the full computation when it's > 2.
             if (
                 name_lower in candidate_lower
                 or candidate_lower in name_lower
-                or self._levenshtein_distance(name_lower, candidate_lower) <= 2
+                or (
+                    abs(len(candidate_lower) - name_len) <= 2
+                    and self._levenshtein_distance(name_lower, candidate_lower) <= 2
+                )
             ):
                 suggestions.append(candidate)
                 if len(suggestions) >= max_results:
@@ -1,18 +1,20 @@
 """Parser for OpenTelemetry Collector configuration files."""
 
+import functools
+import os
 from dataclasses import dataclass, field
-from typing import Optional
-
-import yaml
+from typing import Any, Optional
 
+from .compat import DATACLASS_SLOTS
 from .component_registry import ComponentInfo, get_registry
 from .logger import BuildLogger, get_logger
 from .version import DEFAULT_VERSION
+from .yaml_utils import load_yaml
 
 logger: BuildLogger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ParsedComponents:
     """Container for parsed components from a collector config."""
 
@@ -24,14 +26,12 @@ class ParsedComponents:
 
     def is_empty(self) -> bool:
         """Check if no components were found."""
-        return not any(
-            [
-                self.receivers,
-                self.processors,
-                self.exporters,
-                self.extensions,
-                self.connectors,
-            ]
+        return not (
+            self.receivers
+            or self.processors
+            or self.exporters
+            or self.extensions
+            or self.connectors
         )
 
     def all_components(self) -> dict[str, list[str]]:
@@ -45,7 +45,7 @@ class ParsedComponents:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResolvedComponents:
     """Container for resolved components with their Go module paths."""
 
@@ -82,10 +82,32 @@ class ConfigParser:
         Raises:
             ValueError: If the content is not a valid OTel Collector config structure
         """
-        self._config = yaml.safe_load(config_content)
-        if self._config is None:
-            self._config = {}
-        self._validate_config_schema(self._config)
+        self._config = self._validated(load_yaml(config_content))
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict]) -> "ConfigParser":
+        """Create a parser from an already-deserialized config, skipping YAML parsing.
+
+        Args:
+            config: Collector config as loaded from YAML (None is treated as empty)
+
+        Returns:
+            ConfigParser for the given config
+
+        Raises:
+            ValueError: If the config is not a valid OTel Collector config structure
+        """
+        parser = cls.__new__(cls)
+        parser._config = cls._validated(config)
+        return parser
+
+    @classmethod
+    def _validated(cls, config: Any) -> dict:
+        """Return a deserialized config after validating it (None becomes {})."""
+        if config is None:
+            config = {}
+        cls._validate_config_schema(config)
+        return config
 
     @staticmethod
     def _validate_config_schema(config: object) -> None:
@@ -190,7 +212,7 @@ class ConfigParser:
         base_names = set()
         for key in section_data.keys():
             # Split on "/" to get base name
-            base_name = key.split("/")[0]
+            base_name = key.partition("/")[0]
             base_names.add(base_name)
 
         return sorted(list(base_names))
@@ -210,6 +232,13 @@ class ConfigParser:
         service = self._config.get("service", {})
         pipelines = service.get("pipelines", {})
 
+        # Track names as sets for O(1) membership checks; written back sorted below
+        receivers = set(components.receivers)
+        processors = set(components.processors)
+        exporters = set(components.exporters)
+        extensions = set(components.extensions)
+        connectors = set(components.connectors)
+
         for pipeline_name, pipeline_config in pipelines.items():
             if not pipeline_config:
                 continue
@@ -217,58 +246,58 @@ class ConfigParser:
             # Check receivers in pipeline
             # Note: Connectors can appear as receivers in destination pipelines
             for receiver in pipeline_config.get("receivers", []):
-                base_name = receiver.split("/")[0]
-                if base_name not in components.receivers:
+                base_name = receiver.partition("/")[0]
+                if base_name not in receivers:
                     # Check if it's a connector (connectors act as receivers too)
-                    if base_name not in components.connectors:
+                    if base_name not in connectors:
                         logger.warning(
                             f"Receiver '{receiver}' in pipeline '{pipeline_name}' "
                             f"not found in receivers or connectors section"
                         )
-                        components.receivers.append(base_name)
+                        receivers.add(base_name)
                     # If it's a connector, that's expected - no warning needed
 
             # Check processors in pipeline
             for processor in pipeline_config.get("processors", []):
-                base_name = processor.split("/")[0]
-                if base_name not in components.processors:
+                base_name = processor.partition("/")[0]
+                if base_name not in processors:
                     logger.warning(
                         f"Processor '{processor}' in pipeline '{pipeline_name}' "
                         f"not found in processors section"
                     )
-                    components.processors.append(base_name)
+                    processors.add(base_name)
 
             # Check exporters in pipeline
             # Note: Connectors can appear as exporters in source pipelines
             for exporter in pipeline_config.get("exporters", []):
-                base_name = exporter.split("/")[0]
-                if base_name not in components.exporters:
+                base_name = exporter.partition("/")[0]
+                if base_name not in exporters:
                     # Check if it's a connector (connectors act as exporters too)
-                    if base_name not in components.connectors:
+                    if base_name not in connectors:
                         logger.warning(
                             f"Exporter '{exporter}' in pipeline '{pipeline_name}' "
                             f"not found in exporters or connectors section"
                         )
-                        components.exporters.append(base_name)
+                        exporters.add(base_name)
                     # If it's a connector, that's expected - no warning needed
 
         # Check extensions from service.extensions
         service_extensions = service.get("extensions", [])
         for ext in service_extensions:
-            base_name = ext.split("/")[0]
-            if base_name not in components.extensions:
+            base_name = ext.partition("/")[0]
+            if base_name not in extensions:
                 logger.warning(
                     f"Extension '{ext}' in service.extensions "
                     f"not found in extensions section"
                 )
-                components.extensions.append(base_name)
+                extensions.add(base_name)
 
         # Sort after augmentation
-        components.receivers = sorted(list(set(components.receivers)))
-        components.processors = sorted(list(set(components.processors)))
-        components.exporters = sorted(list(set(components.exporters)))
-        components.extensions = sorted(list(set(components.extensions)))
-        components.connectors = sorted(list(set(components.connectors)))
+        components.receivers = sorted(receivers)
+        components.processors = sorted(processors)
+        components.exporters = sorted(exporters)
+        components.extensions = sorted(extensions)
+        components.connectors = sorted(connectors)
 
 
 def resolve_components(
@@ -305,7 +334,11 @@ def resolve_components(
         result = []
         custom = (custom_mappings or {}).get(component_type, {})
 
-        for name in names:
+        looked_up_all = registry.lookup_many(
+            component_type, names, version, core_version=core_version
+        )
+
+        for name, looked_up in zip(names, looked_up_all):
             # Check custom mappings first
             if name in custom:
                 info = ComponentInfo(
@@ -317,10 +350,7 @@ def resolve_components(
                 result.append(info)
                 continue
 
-            # Look up in registry
-            looked_up = registry.lookup(
-                component_type, name, version, core_version=core_version
-            )
+            # Otherwise use the registry lookup
             if looked_up:
                 result.append(looked_up)
             else:
@@ -349,15 +379,22 @@ def resolve_components(
     return resolved
 
 
-def parse_config_file(config_path: str) -> ParsedComponents:
+def parse_config_file(config_path: str, _cache: bool = False) -> ParsedComponents:
     """Parse an OpenTelemetry Collector config file.
 
     Args:
         config_path: Path to the config file
+        _cache: Reuse the result of an earlier parse of the same, unmodified
+               file. The returned object is shared and must not be mutated.
 
     Returns:
         ParsedComponents with all discovered component names
     """
+    if _cache:
+        return _parse_config_file_cached(
+            os.path.abspath(config_path), os.stat(config_path).st_mtime_ns
+        )
+
     with open(config_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -365,6 +402,12 @@ def parse_config_file(config_path: str) -> ParsedComponents:
     return parser.parse()
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config_file_cached(config_path: str, _mtime_ns: int) -> ParsedComponents:
+    """Parse a config file, memoized on its absolute path and mtime."""
+    return parse_config_file(config_path)
+
+
 def parse_and_resolve(
     config_path: str,
     version: str = DEFAULT_VERSION,
@@ -382,7 +425,7 @@ def parse_and_resolve(
     Returns:
         ResolvedComponents with all resolved components
     """
-    parsed = parse_config_file(config_path)
+    parsed = parse_config_file(config_path, _cache=True)
     return resolve_components(
         parsed, version, custom_mappings, core_version=core_version
     )
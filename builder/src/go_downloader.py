@@ -2,10 +2,12 @@
 
 import os
 import platform
+import shutil
 import sys
 import tarfile
 import tempfile
 import zipfile
+from typing import BinaryIO, cast
 
 import requests
 
@@ -84,9 +86,9 @@ def get_cache_path(version: str) -> str:
 # ── Download and extract ────────────────────────────────────────────────────
 
 
-def _extract_tar_gz(archive_path: str, dest_dir: str) -> None:
-    """Extract a .tar.gz archive to dest_dir."""
-    with tarfile.open(archive_path, "r:gz") as tf:
+def _extract_tar_gz(fileobj: BinaryIO, dest_dir: str) -> None:
+    """Extract a .tar.gz stream to dest_dir without seeking."""
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tf:
         tf.extractall(dest_dir)
 
 
@@ -110,7 +112,6 @@ def _download_go_sdk(version: str, go_os: str, go_arch: str, dest_dir: str) -> s
     """
     url = build_go_url(version, go_os, go_arch)
     is_zip = go_os == "windows"
-    suffix = ".zip" if is_zip else ".tar.gz"
 
     logger.section("Go SDK Download")
     logger.info("Download Details:", indent=1)
@@ -119,42 +120,53 @@ def _download_go_sdk(version: str, go_os: str, go_arch: str, dest_dir: str) -> s
     logger.info(f"Architecture: {go_arch}", indent=2)
     logger.info(f"URL: {url}", indent=2)
 
-    response = requests.get(url, stream=True, timeout=300)
-    content_type = response.headers.get("content-type", "")
-    if response.status_code != 200:
-        raise RuntimeError(
-            f"Failed to download Go SDK from {url}. Status: {response.status_code}"
-        )
-    if "text/html" in content_type:
-        raise RuntimeError(f"Go SDK not found at {url} (got HTML response)")
-
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        try:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    tmp.write(chunk)
-            tmp.close()
-
-            os.makedirs(dest_dir, exist_ok=True)
-
-            if is_zip:
-                _extract_zip(tmp.name, dest_dir)
-            else:
-                _extract_tar_gz(tmp.name, dest_dir)
-        finally:
-            if os.path.exists(tmp.name):
-                os.unlink(tmp.name)
-
-    # The Go archive extracts to a "go/" subdirectory
+    os.makedirs(dest_dir, exist_ok=True)
     go_root = os.path.join(dest_dir, "go")
-    go_binary = os.path.join(go_root, "bin", "go")
-    if go_os == "windows":
-        go_binary += ".exe"
-
-    if not os.path.isfile(go_binary):
-        raise RuntimeError(
-            f"Go binary not found at {go_binary} after extracting archive"
-        )
+    go_binary_rel = os.path.join("bin", "go.exe" if go_os == "windows" else "go")
+
+    # Extract into a staging directory beside the cache entry and only rename
+    # it into place once complete, so an interrupted download never leaves a
+    # partial SDK that get_go_toolchain would later accept as cached.
+    staging_dir = tempfile.mkdtemp(prefix=".extract-", dir=dest_dir)
+    try:
+        with requests.get(url, stream=True, timeout=300) as response:
+            content_type = response.headers.get("content-type", "")
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Failed to download Go SDK from {url}. "
+                    f"Status: {response.status_code}"
+                )
+            if "text/html" in content_type:
+                raise RuntimeError(f"Go SDK not found at {url} (got HTML response)")
+
+            if not is_zip:
+                # Untar straight off the socket rather than saving the archive
+                response.raw.decode_content = True
+                _extract_tar_gz(cast(BinaryIO, response.raw), staging_dir)
+            else:
+                # Zip needs random access to its central directory, so spool
+                # it to disk first
+                archive_path = os.path.join(staging_dir, "go.zip")
+                with open(archive_path, "wb") as archive:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            archive.write(chunk)
+                _extract_zip(archive_path, staging_dir)
+
+        # The Go archive extracts to a "go/" subdirectory
+        staged_root = os.path.join(staging_dir, "go")
+        if not os.path.isfile(os.path.join(staged_root, go_binary_rel)):
+            raise RuntimeError(
+                f"Go binary not found at {os.path.join(go_root, go_binary_rel)} "
+                "after extracting archive"
+            )
+
+        # Clear out any incomplete SDK left behind by an older builder
+        if os.path.exists(go_root):
+            shutil.rmtree(go_root)
+        os.replace(staged_root, go_root)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
     logger.success(f"Go {version} extracted to: {go_root}")
     return go_root
@@ -2,9 +2,9 @@
 
 import os
 import platform
-import shutil
 import tarfile
 import tempfile
+from typing import BinaryIO, cast
 
 import requests
 
@@ -58,41 +58,43 @@ def _download_and_extract(url: str, binary_name: str, output_dir: str) -> str:
     output_path = os.path.join(output_dir, binary_name)
 
     logger.info(f"Downloading from: {url}", indent=1)
-    response = requests.get(url, stream=True, timeout=120)
-    content_type = response.headers.get("content-type", "")
-    if response.status_code != 200:
-        raise RuntimeError(
-            f"Failed to download from {url}. Status: {response.status_code}"
-        )
-    if "text/html" in content_type:
-        raise RuntimeError(f"File not found at {url} (got HTML)")
-
-    os.makedirs(output_dir, exist_ok=True)
-    with tempfile.NamedTemporaryFile(suffix=".tar.gz", delete=False) as tmp:
-        try:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    tmp.write(chunk)
-            tmp.close()
-            with tempfile.TemporaryDirectory() as extract_dir:
-                with tarfile.open(tmp.name, "r:gz") as tf:
-                    tf.extractall(extract_dir)
-                # Walk to find the binary (may be at root or in a subdir)
-                for root, _, files in os.walk(extract_dir):
-                    for f in files:
-                        if f == binary_name:
-                            shutil.copy2(os.path.join(root, f), output_path)
-                            break
-                    else:
-                        continue
-                    break
-                else:
-                    raise RuntimeError(
-                        f"Binary '{binary_name}' not found in archive from {url}"
-                    )
-        finally:
-            if os.path.exists(tmp.name):
-                os.unlink(tmp.name)
+    with requests.get(url, stream=True, timeout=120) as response:
+        content_type = response.headers.get("content-type", "")
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to download from {url}. Status: {response.status_code}"
+            )
+        if "text/html" in content_type:
+            raise RuntimeError(f"File not found at {url} (got HTML)")
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Decompress and untar straight off the socket ("r|gz" never seeks),
+        # copying out only the binary we need instead of saving and unpacking
+        # the archive. Leaving the with block closes the response even when
+        # the rest of the stream is never read.
+        response.raw.decode_content = True
+        with tarfile.open(fileobj=cast(BinaryIO, response.raw), mode="r|gz") as tf:
+            for member in tf:
+                if not member.isfile() or os.path.basename(member.name) != binary_name:
+                    continue
+                src = tf.extractfile(member)
+                if src is None:
+                    continue
+                with tempfile.NamedTemporaryFile(dir=output_dir, delete=False) as tmp:
+                    try:
+                        while chunk := src.read(8192):
+                            tmp.write(chunk)
+                        tmp.close()
+                        os.replace(tmp.name, output_path)
+                    finally:
+                        if os.path.exists(tmp.name):
+                            os.unlink(tmp.name)
+                break
+            else:
+                raise RuntimeError(
+                    f"Binary '{binary_name}' not found in archive from {url}"
+                )
 
     os_raw = _get_os_name_raw()
     if os_raw != "Windows":
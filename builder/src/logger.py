@@ -1,8 +1,11 @@
 """Logging utilities for the OTel builder with colored output support."""
 
 import logging
+import os
 import sys
-from typing import Optional
+import textwrap
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 # ANSI color codes
 HEADER = "\033[95m"
@@ -27,39 +30,117 @@ if not root_logger.handlers:
     root_logger.addHandler(console_handler)
 
 
+class _BufferedLogger:
+    """Minimal logging.Logger stand-in that collects messages in memory."""
+
+    def __init__(self):
+        self.level = logging.NOTSET
+        self.messages: list[str] = []
+
+    def _log(self, level: int, msg: str):
+        self.level = max(self.level, level)
+        self.messages.append(msg)
+
+    def info(self, msg: str):
+        self._log(logging.INFO, msg)
+
+    def warning(self, msg: str):
+        self._log(logging.WARNING, msg)
+
+    def error(self, msg: str):
+        self._log(logging.ERROR, msg)
+
+    def flush(self, logger: logging.Logger):
+        """Emit all collected messages to logger as a single record."""
+        if self.messages:
+            logger.log(self.level, "\n".join(self.messages))
+            self.messages = []
+
+
+def _use_color(stream) -> bool:
+    """Decide whether to emit ANSI colors on stream.
+
+    NO_COLOR disables and FORCE_COLOR enables colors regardless of the stream;
+    otherwise colors are only used when writing to a terminal.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
 class BuildLogger:
     """Logger wrapper that provides formatted output with colors and indentation."""
 
-    def __init__(self, logger):
+    def __init__(self, logger, color: Optional[bool] = None):
         self.logger = logger
+        self.color = _use_color(sys.stdout) if color is None else color
+
+        # Build the message prefixes once rather than on every call
+        if self.color:
+            self._header = HEADER + BOLD
+            self._success = GREEN + "✓ "
+            self._warning = YELLOW + "! "
+            self._error = RED + "✗ "
+            self._command = BLUE + "$ "
+            self._end = END
+        else:
+            self._header = ""
+            self._success = "✓ "
+            self._warning = "! "
+            self._error = "✗ "
+            self._command = "$ "
+            self._end = ""
 
     def section(self, title: str):
         """Log a section header."""
-        self.logger.info(f"\n{HEADER}{BOLD}=== {title} ==={END}\n")
+        self.logger.info(
+            "\n" + self._header + "=== " + title + " ===" + self._end + "\n"
+        )
 
     def success(self, msg: str):
         """Log a success message."""
-        self.logger.info(f"{GREEN}✓ {msg}{END}")
+        self.logger.info(self._success + msg + self._end)
 
     def warning(self, msg: str):
         """Log a warning message."""
-        self.logger.warning(f"{YELLOW}! {msg}{END}")
+        self.logger.warning(self._warning + msg + self._end)
 
     def error(self, msg: str):
         """Log an error message."""
-        self.logger.error(f"{RED}✗ {msg}{END}")
+        self.logger.error(self._error + msg + self._end)
 
     def info(self, msg: str, indent: int = 0):
-        """Log an info message with optional indentation."""
-        prefix = "  " * indent
-        self.logger.info(f"{prefix}{msg}")
+        """Log an info message with optional indentation.
+
+        Every line of a multi-line message is indented.
+        """
+        if indent:
+            msg = textwrap.indent(msg, "  " * indent, lambda _: True)
+        self.logger.info(msg)
 
     def command(self, cmd: str, output: Optional[str] = None):
         """Log a command execution and its output."""
-        self.logger.info(f"{BLUE}$ {cmd}{END}")
+        # Emit the command and its output as one record instead of one per line
+        msg = self._command + cmd + self._end
         if output:
-            for line in output.splitlines():
-                self.logger.info(f"  {line}")
+            msg += "\n" + textwrap.indent(output.rstrip("\n"), "  ", lambda _: True)
+        self.logger.info(msg)
+
+    @contextmanager
+    def buffered(self) -> Iterator["BuildLogger"]:
+        """Collect messages and emit them as one log record when the block exits.
+
+        Keeps the lines of a single task together and takes the handler lock
+        once instead of once per line.
+        """
+        buffer = _BufferedLogger()
+        try:
+            yield BuildLogger(buffer, color=self.color)
+        finally:
+            buffer.flush(self.logger)
 
 
 def get_logger(name: str) -> BuildLogger:
@@ -10,10 +10,12 @@ import yaml
 
 from . import build
 from .logger import BuildLogger, get_logger
-from .platforms import resolve_platform_pairs, resolve_platforms
+from .platforms import (resolve_platform_pairs, resolve_platforms,
+                        split_comma_list)
 from .resources import (get_bindplane_components_yaml_path,
                         get_versions_yaml_path)
 from .version import get_core_version
+from .yaml_utils import load_yaml
 
 logger: BuildLogger = get_logger(__name__)
 
@@ -34,7 +36,7 @@ def get_latest_otel_version() -> str:
     try:
         versions_path = get_versions_yaml_path()
         with open(versions_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         if data and "versions" in data:
             # Get the first (latest) version key
@@ -58,7 +60,7 @@ def get_default_bindplane_version() -> str:
     try:
         bp_path = get_bindplane_components_yaml_path()
         with open(bp_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         if data and "version" in data:
             return str(data["version"])
@@ -225,12 +227,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--goos",
-        type=str,
+        type=split_comma_list,
         help="Comma-separated list of target operating systems (overrides manifest)",
     )
     parser.add_argument(
         "--goarch",
-        type=str,
+        type=split_comma_list,
         help="Comma-separated list of target architectures (overrides manifest)",
     )
     parser.add_argument(
@@ -6,10 +6,12 @@ from typing import Any, Optional
 
 import yaml
 
+from .compat import DATACLASS_SLOTS
 from .config_parser import ResolvedComponents
 from .logger import BuildLogger, get_logger
 from .resources import get_bindplane_components_yaml_path
 from .version import DEFAULT_VERSION, get_core_version
+from .yaml_utils import load_yaml
 
 logger: BuildLogger = get_logger(__name__)
 
@@ -53,9 +55,12 @@ DEFAULT_REPLACES = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ManifestConfig:
-    """Configuration for manifest generation."""
+    """Configuration for manifest generation.
+
+    Frozen so a single instance can be shared between generators.
+    """
 
     module: str = DEFAULT_MODULE
     name: str = DEFAULT_NAME
@@ -111,7 +116,7 @@ class ManifestGenerator:
         bindplane_file = get_bindplane_components_yaml_path()
         try:
             with open(bindplane_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
 
             # Use CLI-provided version if set, otherwise use file's version
             version = self._config.bindplane_version or data.get("version")
@@ -1,7 +1,7 @@
 """Platform handling utilities for the OTel Distro Builder."""
 
 import platform
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 
 # Map Python's platform.system() to Go's GOOS
 _GOOS_MAP = {
@@ -34,6 +34,28 @@ def get_host_platform() -> tuple[str, str]:
     return host_os, host_arch
 
 
+def split_comma_list(value: str) -> List[str]:
+    """Split a comma-separated value, dropping empty items.
+
+    Used as the argparse ``type`` for --goos/--goarch so the split happens
+    once, when the command line is parsed.
+
+    Args:
+        value: Comma-separated list (e.g. "linux,darwin")
+
+    Returns:
+        List of stripped, non-empty items.
+    """
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _as_list(value: Union[str, Sequence[str], None]) -> List[str]:
+    """Normalize a goos/goarch value that may be unsplit or already a list."""
+    if isinstance(value, str):
+        return split_comma_list(value)
+    return list(value or [])
+
+
 def parse_platform_pairs(platforms: Optional[str]) -> List[Tuple[str, str]]:
     """
     Parse platforms string into a list of (os, arch) pairs.
@@ -98,8 +120,8 @@ def parse_platforms(platforms: Optional[str]) -> Tuple[List[str], List[str]]:
 
 def resolve_platforms(
     platforms: Optional[str] = None,
-    goos: Optional[str] = None,
-    goarch: Optional[str] = None,
+    goos: Union[str, Sequence[str], None] = None,
+    goarch: Union[str, Sequence[str], None] = None,
 ) -> Tuple[List[str], List[str]]:
     """
     Resolve target platforms based on input parameters.
@@ -111,8 +133,8 @@ def resolve_platforms(
 
     Args:
         platforms: Comma-separated list of platforms in GOOS/GOARCH format
-        goos: Comma-separated list of operating systems
-        goarch: Comma-separated list of architectures
+        goos: Operating systems, as a list or a comma-separated string
+        goarch: Architectures, as a list or a comma-separated string
 
     Returns:
         Tuple of (list of operating systems, list of architectures)
@@ -121,10 +143,7 @@ def resolve_platforms(
 
     # If either goos or goarch is explicitly set, they take precedence
     if goos is not None or goarch is not None:
-        return (
-            goos.split(",") if goos else [host_os],
-            goarch.split(",") if goarch else [host_arch],
-        )
+        return _as_list(goos) or [host_os], _as_list(goarch) or [host_arch]
 
     # If platforms is set and neither goos nor goarch are set, parse platforms
     if platforms:
@@ -140,8 +159,8 @@ def resolve_platforms(
 
 def resolve_platform_pairs(
     platforms: Optional[str] = None,
-    goos: Optional[str] = None,
-    goarch: Optional[str] = None,
+    goos: Union[str, Sequence[str], None] = None,
+    goarch: Union[str, Sequence[str], None] = None,
 ) -> List[Tuple[str, str]]:
     """
     Resolve target platforms as a list of (os, arch) pairs.
@@ -151,8 +170,8 @@ def resolve_platform_pairs(
 
     Args:
         platforms: Comma-separated list of platforms in GOOS/GOARCH format
-        goos: Comma-separated list of operating systems
-        goarch: Comma-separated list of architectures
+        goos: Operating systems, as a list or a comma-separated string
+        goarch: Architectures, as a list or a comma-separated string
 
     Returns:
         List of (os, arch) tuples representing exact target platforms.
@@ -161,8 +180,8 @@ def resolve_platform_pairs(
 
     # If either goos or goarch is explicitly set, return cross-product
     if goos is not None or goarch is not None:
-        os_list = goos.split(",") if goos else [host_os]
-        arch_list = goarch.split(",") if goarch else [host_arch]
+        os_list = _as_list(goos) or [host_os]
+        arch_list = _as_list(goarch) or [host_arch]
         return [(o, a) for o in os_list for a in arch_list]
 
     # If platforms is set, return exact pairs
@@ -1,11 +1,14 @@
 """Utility for downloading OpenTelemetry OpAMP Supervisor releases."""
 
+import json
 import os
+import tempfile
 from typing import Optional
 
 import requests
 
 from .logger import BuildLogger, get_logger
+from .ocb_downloader import set_permissions
 
 logger: BuildLogger = get_logger(__name__)
 
@@ -19,32 +22,86 @@ ALL_PLATFORMS = [
     ("windows", "amd64"),
 ]
 
+# Per-output-dir record of the ETag served for each downloaded URL
+ETAG_CACHE_FILE = ".supervisor_cache.json"
 
-def download_file(url, output_file):
-    """Download a file from a given URL and save it to the specified path."""
-    logger.info(f"Downloading {url}...", indent=2)
 
+def _load_etag_cache(output_dir: str) -> dict[str, str]:
+    """Load the {url: etag} cache for output_dir, or an empty cache."""
     try:
-        response = requests.get(url, stream=True, timeout=30)
+        with open(
+            os.path.join(output_dir, ETAG_CACHE_FILE), "r", encoding="utf-8"
+        ) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_etag_cache(output_dir: str, cache: dict[str, str]) -> None:
+    """Persist the {url: etag} cache for output_dir."""
+    with open(os.path.join(output_dir, ETAG_CACHE_FILE), "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def download_file(
+    url,
+    output_file,
+    etag: Optional[str] = None,
+    log: Optional[BuildLogger] = None,
+) -> Optional[str]:
+    """Download a file from a given URL and save it to the specified path.
+
+    Args:
+        url: URL to download.
+        output_file: Path to write the file to.
+        etag: ETag of a previous download of url. If given and output_file
+            still exists, the download is skipped when the server answers 304.
+        log: Logger to report progress to. Defaults to the module logger.
+
+    Returns:
+        The ETag of the file now at output_file, or None if unknown.
+    """
+    log = log or logger
+    log.info(f"Downloading {url}...", indent=2)
+
+    headers = {}
+    if etag and os.path.isfile(output_file):
+        headers["If-None-Match"] = etag
+
+    try:
+        response = requests.get(url, stream=True, timeout=30, headers=headers)
+        if response.status_code == 304:
+            log.success(f"Using cached {output_file} (unchanged upstream)")
+            return etag
         if response.status_code == 200:
-            with open(output_file, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
-            logger.success(f"Successfully downloaded {url}")
-        else:
-            logger.error(f"Failed to download {url}: {response.status_code}")
+            # Write to a sibling temp file and atomically rename it into place so
+            # an interrupted download never leaves a truncated binary behind.
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(output_file) or ".", delete=False
+            ) as tmp:
+                try:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            tmp.write(chunk)
+                    tmp.close()
+                    # NamedTemporaryFile creates the file 0600; give it the
+                    # usual permissions, as binaries skipped by
+                    # set_permissions (Windows) are packaged as-is
+                    os.chmod(tmp.name, 0o644)
+                    os.replace(tmp.name, output_file)
+                finally:
+                    if os.path.exists(tmp.name):
+                        os.unlink(tmp.name)
+            log.success(f"Successfully downloaded {url}")
+            return response.headers.get("ETag")
+        log.error(f"Failed to download {url}: {response.status_code}")
+        return None
     except Exception as e:
-        logger.error(f"Failed to download {url}: {e}")
+        log.error(f"Failed to download {url}: {e}")
         raise
 
 
-def set_permissions(file_path, os_name):
-    """Set appropriate permissions for the downloaded file."""
-    if os_name != "windows":
-        os.chmod(file_path, 0o777)
-        logger.info(f"Set executable permissions for: {file_path}", indent=1)
-
-
 def download_supervisor(
     output_dir: str,
     version: str,
@@ -77,6 +134,7 @@ def download_supervisor(
     logger.info(f"Output: {output_dir}", indent=2)
     logger.info(f"Platforms: {to_download}", indent=2)
 
+    etag_cache = _load_etag_cache(output_dir)
     try:
         for os_name, arch in to_download:
             # Generate artifact name, output file, and download URL
@@ -87,9 +145,21 @@ def download_supervisor(
                 output_file += ".exe"
             download_url = f"{base_url}/{artifact_name}"
 
-            download_file(download_url, output_file)
+            with logger.buffered() as file_log:
+                etag = download_file(
+                    download_url,
+                    output_file,
+                    etag=etag_cache.get(download_url),
+                    log=file_log,
+                )
+            if etag:
+                etag_cache[download_url] = etag
+            else:
+                etag_cache.pop(download_url, None)
             set_permissions(output_file, os_name)
 
+        _save_etag_cache(output_dir, etag_cache)
+
         logger.success(
             f"Successfully downloaded supervisor artifacts for version: {version}"
         )
@@ -2,16 +2,26 @@
 
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, TextIO
 
 import yaml
 from packaging import version
 
 from .resources import get_versions_yaml_path
+from .yaml_utils import YAML_LOADER, load_yaml
 
 CONTRIB_PREFIX = "github.com/open-telemetry/opentelemetry-collector-contrib/"
 MIN_SUPERVISOR_VERSION = "0.122.0"
 
+# Block-style "gomod: <contrib module> vX.Y.Z" lines, as written by OCB
+# manifests, optionally followed by an inline "# comment"
+_CONTRIB_GOMOD_RE = re.compile(
+    r"^[ \t-]*gomod:[ \t]*[\"']?"
+    + re.escape(CONTRIB_PREFIX)
+    + r"\S+[ \t]+v(\d+\.\d+\.\d+)[\"']?(?:[ \t]+#.*)?[ \t]*$",
+    re.MULTILINE,
+)
+
 # Fallback if versions.yaml cannot be read
 _FALLBACK_VERSION = "0.147.0"
 
@@ -26,16 +36,46 @@ def _get_latest_version() -> str:
     try:
         versions_file = get_versions_yaml_path()
         with open(versions_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        if data and "versions" in data:
-            keys = list(data["versions"].keys())
-            if keys:
-                return str(keys[0])
+            latest = _first_versions_key(f)
+        if latest:
+            return latest
     except (FileNotFoundError, yaml.YAMLError, KeyError):
         pass
     return _FALLBACK_VERSION
 
 
+def _first_versions_key(stream: TextIO) -> Optional[str]:
+    """Return the first key of the top-level ``versions`` mapping.
+
+    This runs at import time, so it walks the YAML event stream and stops at
+    the first key instead of constructing the whole versions.yaml document.
+
+    Args:
+        stream: Open versions.yaml file
+
+    Returns:
+        The first version key, or None if there is no versions mapping
+    """
+    depth = 0
+    previous = None
+    events = yaml.parse(stream, Loader=YAML_LOADER)
+    for event in events:
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            if (
+                depth == 1
+                and isinstance(event, yaml.MappingStartEvent)
+                and isinstance(previous, yaml.ScalarEvent)
+                and previous.value == "versions"
+            ):
+                first = next(events, None)
+                return first.value if isinstance(first, yaml.ScalarEvent) else None
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        previous = event
+    return None
+
+
 DEFAULT_VERSION = _get_latest_version()
 
 
@@ -53,7 +93,7 @@ def load_version_mappings() -> dict:
     """Load version mappings from versions.yaml."""
     versions_file = get_versions_yaml_path()
     with open(versions_file, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
     return data["versions"]
 
 
@@ -138,7 +178,29 @@ def get_contrib_version_from_manifest(manifest_content: str) -> str:
     Raises:
         ValueError: If version cannot be determined from manifest
     """
-    manifest = yaml.safe_load(manifest_content)
+    # Scanning the raw text is much cheaper than a full parse; fall back to
+    # parsing for manifests that aren't written in the usual block style
+    versions = set(_CONTRIB_GOMOD_RE.findall(manifest_content))
+    if not versions:
+        versions = _contrib_versions_from_yaml(manifest_content)
+
+    if not versions:
+        raise ValueError("No contrib components found in manifest")
+
+    # Return the highest version
+    return str(max(version.parse(v) for v in versions))
+
+
+def _contrib_versions_from_yaml(manifest_content: str) -> set[str]:
+    """Collect contrib component versions by parsing the manifest as YAML.
+
+    Args:
+        manifest_content: Content of the manifest file
+
+    Returns:
+        The set of contrib versions found (without the 'v' prefix)
+    """
+    manifest = load_yaml(manifest_content)
 
     # Sections that can contain contrib components
     sections = [
@@ -171,11 +233,7 @@ def get_contrib_version_from_manifest(manifest_content: str) -> str:
                 if match:
                     versions.add(match.group(1))
 
-    if not versions:
-        raise ValueError("No contrib components found in manifest")
-
-    # Return the highest version
-    return str(max(version.parse(v) for v in versions))
+    return versions
 
 
 def get_core_version(contrib_version: str) -> str:
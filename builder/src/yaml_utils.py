@@ -0,0 +1,20 @@
+"""Shared YAML loading helpers."""
+
+from typing import IO, Any, Union
+
+import yaml
+
+# Prefer the libyaml-backed loader; fall back to pure Python if it's unavailable
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse YAML the way yaml.safe_load does, using libyaml when available.
+
+    Args:
+        stream: YAML text or an open file
+
+    Returns:
+        The parsed document
+    """
+    return yaml.load(stream, Loader=YAML_LOADER)
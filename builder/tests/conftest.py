@@ -1,10 +1,133 @@
 """Test configuration and path setup for the OTel builder tests."""
 
+import os
+import subprocess
 import sys
+import time
 from pathlib import Path
 
+import pytest
+
 # Add the src directory to Python path
 ROOT_DIR = Path(__file__).parent.parent
 BUILDER_DIR = str(ROOT_DIR / "builder" / "src")
 sys.path.insert(0, BUILDER_DIR)
 sys.path.insert(0, str(ROOT_DIR))
+
+# Longest an xdist worker waits for another worker's builder image build
+BUILDER_IMAGE_TIMEOUT = 30 * 60
+
+
+def _build_builder_image(image_name: str) -> None:
+    """Build the builder Docker image, raising RuntimeError on failure."""
+    build_result = subprocess.run(
+        ["docker", "build", "-t", image_name, "."],
+        cwd=ROOT_DIR,  # builder/, which holds the Dockerfile
+        capture_output=True,
+        text=True,
+        check=False,
+        # BuildKit reuses unchanged layers across sessions
+        env={**os.environ, "DOCKER_BUILDKIT": "1"},
+    )
+    if build_result.returncode != 0:
+        print("\nDocker Build Output:")
+        print(build_result.stdout)
+        print("\nDocker Build Errors:")
+        print(build_result.stderr)
+        raise RuntimeError("Docker build failed")
+
+
+def _wait_for_builder_image(
+    status_file: Path, timeout: float = BUILDER_IMAGE_TIMEOUT
+) -> None:
+    """Wait for another xdist worker to finish building the builder image.
+
+    The building worker writes a status even when its build fails; the
+    deadline covers a worker that dies before it gets the chance.
+    """
+    deadline = time.monotonic() + timeout
+    while not status_file.exists():
+        if time.monotonic() > deadline:
+            raise RuntimeError(
+                f"Timed out after {timeout:.0f}s waiting for another worker "
+                f"to build the builder image ({status_file} never appeared)"
+            )
+        time.sleep(1)
+    if status_file.read_text(encoding="utf-8") != "ok":
+        raise RuntimeError("Docker build failed in another worker")
+
+
+@pytest.fixture(scope="session")
+def builder_image(tmp_path_factory) -> str:
+    """Build the builder Docker image once per test session and return its tag.
+
+    Under pytest-xdist, the first worker to create the lock file builds the
+    image and the others wait for its result instead of building it again.
+    """
+    image_name = "otel-distro-builder"
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        _build_builder_image(image_name)
+        return image_name
+
+    # The parent of each worker's base temp dir is shared by all workers
+    shared_dir = tmp_path_factory.getbasetemp().parent
+    lock_file = shared_dir / "builder_image.lock"
+    status_file = shared_dir / "builder_image.status"
+    try:
+        os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        _wait_for_builder_image(status_file)
+        return image_name
+
+    status = "failed"
+    try:
+        _build_builder_image(image_name)
+        status = "ok"
+    finally:
+        # Always record a status, so waiting workers stop even when the build
+        # raises. Write then rename so they never read a partial status.
+        tmp_status = status_file.with_suffix(".tmp")
+        tmp_status.write_text(status, encoding="utf-8")
+        os.replace(tmp_status, status_file)
+    return image_name
+
+
+@pytest.fixture(scope="session")
+def parsed_configs() -> dict:
+    """Parse every collector config under tests/configs/otelcol once per session.
+
+    Returns:
+        Mapping of config file stem (e.g. "simple") to its ParsedComponents
+    """
+    # pylint: disable=import-outside-toplevel
+    from builder.src.config_parser import parse_config_file
+
+    configs_dir = ROOT_DIR / "tests" / "configs" / "otelcol"
+    # Go through the parse_config_file cache so parse_and_resolve reuses these
+    return {
+        path.stem: parse_config_file(str(path), _cache=True)
+        for path in sorted(configs_dir.glob("*.yaml"))
+    }
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """Return the component registry, loaded once for the session."""
+    # pylint: disable=import-outside-toplevel
+    from builder.src.component_registry import get_registry
+
+    return get_registry()
+
+
+@pytest.fixture(scope="session")
+def resolved_otlp_debug():
+    """Return the resolved otlp receiver + debug exporter pair used by most tests.
+
+    Manifest generation only reads the resolved components, so one instance can
+    be shared across the session.
+    """
+    # pylint: disable=import-outside-toplevel
+    from builder.src.config_parser import ParsedComponents, resolve_components
+
+    parsed = ParsedComponents(receivers=["otlp"], exporters=["debug"])
+    return resolve_components(parsed, version="0.147.0")
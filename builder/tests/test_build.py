@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import fnmatch
+import hashlib
 import os
 import platform
 import shutil
 import subprocess
 import time
+import uuid
 from pathlib import Path
 
 import pytest
@@ -24,6 +29,21 @@ def get_host_arch() -> str:
     return arch_map.get(machine, machine)
 
 
+# Number of trailing build log lines shown when a build fails
+BUILD_LOG_TAIL_LINES = 200
+
+# Longest single build log line the stream reader accepts
+BUILD_LOG_LINE_LIMIT = 1 << 20
+
+# Docker volume holding GOCACHE/GOMODCACHE for the builder containers. Go's
+# caches are content-addressed and safe for concurrent use, so every build
+# (and xdist worker) shares it and only recompiles what its manifest changes.
+GO_CACHE_VOLUME = "otel-distro-builder-test-gocache"
+
+# Written into a cached artifact directory once its build has been verified;
+# caching is opt-in with OTEL_BUILDER_TEST_CACHE=1
+BUILD_CACHE_MARKER = ".build-complete"
+
 # Expected artifacts for each build type
 LINUX_ARM64_ARTIFACTS = [
     # collector-only artifacts
@@ -72,191 +92,488 @@ LINUX_AMD64_ARTIFACTS = [
 ]
 
 
-def verify_build_artifacts(artifact_path: Path, expected_artifacts: list[str]) -> None:
+def verify_expected_artifacts(
+    artifact_path: Path, expected_artifacts: list[str]
+) -> None:
     """Verify all expected build artifacts exist."""
+    # Scan the directory once and check each expectation against the listing
+    with os.scandir(artifact_path) as it:
+        names = {entry.name for entry in it}
     for pattern in expected_artifacts:
-        matches = list(artifact_path.glob(pattern))
-        assert len(matches) > 0, f"Expected artifact {pattern} not found"
-
-    # Check for raw binary - support both underscore and hyphen variants
-    binary_dirs = (
-        list(artifact_path.glob("otelcol_*"))
-        + list(artifact_path.glob("otelcol-*"))
-        + list(artifact_path.glob("otelcol-contrib"))  # Exact match without suffix
-    )
+        if any(ch in pattern for ch in "*?["):
+            found = bool(fnmatch.filter(names, pattern))
+        else:
+            found = pattern in names
+        assert found, f"Expected artifact {pattern} not found in {sorted(names)}"
+
+
+def verify_binary_dirs(artifact_path: Path) -> None:
+    """Verify the raw collector binary directories exist and are non-empty."""
+    with os.scandir(artifact_path) as it:
+        entries = {entry.name: entry for entry in it}
+    names = entries.keys()
+
+    # Support both underscore and hyphen variants
+    binary_dirs = set(fnmatch.filter(names, "otelcol_*"))
+    binary_dirs.update(fnmatch.filter(names, "otelcol-*"))
+    if "otelcol-contrib" in names:  # Exact match without suffix
+        binary_dirs.add("otelcol-contrib")
     assert len(binary_dirs) > 0, "No binary directories found"
-    for binary_dir in binary_dirs:
-        if binary_dir.is_dir():  # Skip if it's a package file
-            assert any(binary_dir.iterdir()), f"Binary directory {binary_dir} is empty"
+    for name in sorted(binary_dirs):
+        entry = entries[name]
+        # Skip package files; the listing already knows each entry's type
+        if entry.is_dir():
+            with os.scandir(entry.path) as it:
+                assert (
+                    next(it, None) is not None
+                ), f"Binary directory {entry.path} is empty"
+
+
+def relax_permissions(root: Path) -> None:
+    """Make every entry under root owner-writable in a single walk.
+
+    Docker-created artifacts can be read-only; fixing them up front lets
+    shutil.rmtree delete the tree without hitting per-file permission errors.
+    Uses os.scandir so each entry's type comes from the directory listing
+    and its path is reused as-is rather than rebuilt with os.path.join.
+    """
+    try:
+        os.chmod(root, 0o700)
+    except OSError:
+        pass
+    # Directories are chmodded before they are pushed, so they can be listed
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # Leave symlinks alone; chmod would follow them out of the tree
+                    if entry.is_symlink():
+                        continue
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    try:
+                        os.chmod(entry.path, 0o700 if is_dir else 0o600)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        stack.append(entry.path)
+        except OSError:
+            pass
 
 
 def remove_readonly(func, path, _exc):
-    """Handle permission errors during deletion by recursively changing permissions"""
+    """Handle a permission error during deletion by fixing up just that path."""
     try:
-        # Recursively change permissions for directories
-        if os.path.isdir(path):
-            for root, dirs, files in os.walk(path):
-                for d in dirs:
-                    dirpath = os.path.join(root, d)
-                    os.chmod(dirpath, 0o666)  # rw permissions
-                for f in files:
-                    filepath = os.path.join(root, f)
-                    # Remove execute bit first
-                    os.chmod(filepath, 0o666)  # rw permissions
-
-        # Change permissions of the path itself
-        if os.path.isfile(path):
-            os.chmod(path, 0o666)  # rw permissions
-        else:
-            os.chmod(path, 0o777)  # rwx for directories
+        os.chmod(path, 0o700)
         func(path)
     except (OSError, PermissionError) as e:
         print(f"Error while removing {path}: {e}")
 
 
-def run_build_test(
-    manifest_name: str, expected_artifacts: list[str], env_inputs: dict | None = None
-) -> None:
-    """Run a build test for a specific manifest file.
+def remove_artifact_dir(artifact_dir: Path, attempts: int = 5) -> None:
+    """Remove an artifact directory, including read-only entries.
+
+    On Windows the container may still hold file handles for a moment after
+    it exits, so removal is retried with a short exponential backoff. The
+    first attempt almost always succeeds, so usually there is no wait.
+    """
+    relax_permissions(artifact_dir)
+    for attempt in range(attempts):
+        shutil.rmtree(artifact_dir, onerror=remove_readonly)
+        if not artifact_dir.exists():
+            return
+        time.sleep(0.05 * 2**attempt)
+    raise OSError(f"Could not remove {artifact_dir}")
+
+
+def build_cache_enabled() -> bool:
+    """Whether builds are cached across runs (OTEL_BUILDER_TEST_CACHE=1)."""
+    return os.environ.get("OTEL_BUILDER_TEST_CACHE") == "1"
+
+
+async def build_cache_key(
+    image_name: str, manifest_path: Path, env_inputs: dict | None
+) -> str:
+    """Key a build by its manifest, builder image and environment inputs.
+
+    Runs docker without blocking, so concurrent builds keep making progress.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "docker",
+        "image",
+        "inspect",
+        "--format",
+        "{{.Id}}",
+        image_name,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    image_id, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(
+            proc.returncode or 1, "docker image inspect", image_id, stderr
+        )
+    digest = hashlib.sha256(manifest_path.read_bytes())
+    digest.update(image_id.strip())
+    for k, v in sorted((env_inputs or {}).items()):
+        digest.update(f"\0{k}={v}".encode())
+    return digest.hexdigest()[:16]
+
+
+def print_artifact_dir_debug(artifact_dir: Path) -> None:
+    """Print the artifact directory tree with file sizes, and its permissions."""
+    print("\nArtifact Directory Contents:")
+    # One stat answers both "does it exist" and the permissions below
+    try:
+        st: os.stat_result | None = os.stat(artifact_dir)
+        stat_error: OSError | None = None
+    except OSError as e:
+        st, stat_error = None, e
+    if st is not None:
+        print(f"Directory exists: {artifact_dir}")
+        print("Files:")
+        # Walk with os.scandir so each entry's type comes from the listing and
+        # is stat'ed at most once (for the size of regular files)
+        stack = [(os.fspath(artifact_dir), "")]
+        while stack:
+            dirpath, rel = stack.pop()
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    rel_path = f"{rel}/{entry.name}" if rel else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        print(f"  {rel_path}/")
+                        stack.append((entry.path, rel_path))
+                    elif entry.is_file(follow_symlinks=False):
+                        print(f"  {rel_path} ({entry.stat().st_size} bytes)")
+                    else:
+                        print(f"  {rel_path}")
+    else:
+        print(f"Directory does not exist: {artifact_dir}")
+
+    print("\nDirectory Permissions:")
+    if st is not None:
+        print(f"Mode: {st.st_mode:o}")
+        print(f"Owner: {st.st_uid}")
+        print(f"Group: {st.st_gid}")
+    else:
+        print(f"Error getting permissions: {stat_error}")
+
+
+async def stop_build(proc: asyncio.subprocess.Process, container_name: str) -> None:
+    """Stop an interrupted build's docker client and its container.
+
+    Killing only the client would leave the container running, so it is
+    killed by name too.
+    """
+    if proc.returncode is None:
+        proc.kill()
+        await proc.wait()
+    killer = await asyncio.create_subprocess_exec(
+        "docker",
+        "kill",
+        container_name,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await killer.wait()
+
+
+async def chown_to_host_user(image_name: str, artifact_dir: Path) -> None:
+    """Hand the container's root-owned output back to the host user.
+
+    Without this, pytest's tmp_path cleanup (and remove_artifact_dir) can't
+    delete what the build wrote on Linux hosts. Not needed on Windows,
+    where bind-mounted files aren't owned by root.
+    """
+    if not hasattr(os, "getuid"):
+        return
+    proc = await asyncio.create_subprocess_exec(
+        "docker",
+        "run",
+        "--rm",
+        "-v",
+        f"{artifact_dir}:/artifacts",
+        "--entrypoint",
+        "chown",
+        image_name,
+        "-R",
+        f"{os.getuid()}:{os.getgid()}",
+        "/artifacts",
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        print(f"Could not chown {artifact_dir}: {stderr.decode(errors='replace')}")
+
+
+async def build_distribution(
+    image_name: str,
+    work_dir: Path,
+    manifest_name: str,
+    env_inputs: dict | None = None,
+) -> Path:
+    """Build a distribution from a test manifest and return its artifact dir.
 
     Args:
+        image_name: Tag of the builder Docker image to run
+        work_dir: Directory to write the artifacts to
         manifest_name: Name of the manifest file to use
-        expected_artifacts: List of artifacts to verify
         env_inputs: Optional dict of environment variables (for GitHub Actions style inputs)
+
+    Returns:
+        Path to the directory holding the build artifacts
     """
     manifest_path = Path(__file__).parent / "manifests" / manifest_name
     assert manifest_path.exists(), f"Manifest file not found: {manifest_name}"
 
-    # Create artifacts directory in the workspace root
-    workspace_root = Path(__file__).parent.parent.parent
-    artifact_dir = workspace_root / "artifacts"
-    if artifact_dir.exists():
-        shutil.rmtree(artifact_dir, onerror=remove_readonly)
-    artifact_dir.mkdir(exist_ok=True)
-
-    try:
-        # Build the Docker image
-        builder_dir = workspace_root / "builder"
-        image_name = "otel-distro-builder"
-        build_result = subprocess.run(
-            ["docker", "build", "-t", image_name, "."],
-            cwd=builder_dir,
-            capture_output=True,
-            text=True,
-            check=False,
+    if build_cache_enabled():
+        # Keep artifacts under a key for this manifest/image/inputs and reuse
+        # them when a previous run already built them successfully.
+        workspace_root = Path(__file__).parent.parent.parent
+        artifact_dir = (
+            workspace_root
+            / "artifacts-cache"
+            / await build_cache_key(image_name, manifest_path, env_inputs)
         )
-        if build_result.returncode != 0:
-            print("\nDocker Build Output:")
-            print(build_result.stdout)
-            print("\nDocker Build Errors:")
-            print(build_result.stderr)
-            raise RuntimeError("Docker build failed")
-
-        # Run the container with fixed mount points like run_local_build.sh
-        cmd = [
-            "docker",
-            "run",
-            "--rm",
-            "-v",
-            f"{manifest_path}:/manifest.yaml:ro",
-            "-v",
-            f"{artifact_dir}:/artifacts",
-        ]
-
-        # Add any environment variables if provided
-        if env_inputs:
-            for k, v in env_inputs.items():
-                cmd.extend(["-e", f"{k}={v}"])
-
-        cmd.append(image_name)
-        cmd.extend(["--manifest", "/manifest.yaml", "--artifacts", "/artifacts"])
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
+        if (artifact_dir / BUILD_CACHE_MARKER).exists():
+            return artifact_dir
+        # A directory without the marker is left over from a failed build
+        if artifact_dir.exists():
+            remove_artifact_dir(artifact_dir)
+        artifact_dir.mkdir(parents=True)
+    else:
+        # The work dir is unique per build (and xdist worker), so there is
+        # nothing to clear first; pytest removes it again on green runs once
+        # chown_to_host_user has handed the output back.
+        artifact_dir = work_dir / "artifacts"
+        artifact_dir.mkdir()
+
+    # Run the container with fixed mount points like run_local_build.sh. It is
+    # named so an interrupted build can kill it; --init forwards signals.
+    container_name = f"otel-distro-builder-test-{uuid.uuid4().hex[:12]}"
+    cmd = [
+        "docker",
+        "run",
+        "--rm",
+        "--init",
+        "--name",
+        container_name,
+        "-v",
+        f"{manifest_path}:/manifest.yaml:ro",
+        "-v",
+        f"{artifact_dir}:/artifacts",
+        # Share Go's build and module caches between builds
+        "-v",
+        f"{GO_CACHE_VOLUME}:/gocache",
+        "-e",
+        "GOCACHE=/gocache/build",
+        "-e",
+        "GOMODCACHE=/gocache/mod",
+    ]
+
+    # Add any environment variables if provided
+    if env_inputs:
+        for k, v in env_inputs.items():
+            cmd.extend(["-e", f"{k}={v}"])
+
+    cmd.append(image_name)
+    cmd.extend(["--manifest", "/manifest.yaml", "--artifacts", "/artifacts"])
+
+    # Stream the (potentially very large) build log line by line, keeping
+    # only its tail, undecoded, for the failure report.
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=BUILD_LOG_LINE_LIMIT,
+    )
+    assert proc.stdout is not None
+    log_tail: collections.deque[bytes] = collections.deque(maxlen=BUILD_LOG_TAIL_LINES)
+    try:
+        while line := await proc.stdout.readline():
+            log_tail.append(line)
+        returncode = await proc.wait()
+    except asyncio.CancelledError:
+        # Cancelled by a failing sibling build or Ctrl-C
+        await stop_build(proc, container_name)
+        raise
+    await chown_to_host_user(image_name, artifact_dir)
+
+    # The directory listing is only worth its syscalls when something
+    # went wrong, or when asked for with OTEL_BUILDER_TEST_VERBOSE
+    if returncode != 0:
+        print(
+            f"\nBuild Output for {manifest_name} (last {BUILD_LOG_TAIL_LINES} lines):"
         )
+        print(b"".join(log_tail).decode(errors="replace"))
+        print_artifact_dir_debug(artifact_dir)
+    elif os.environ.get("OTEL_BUILDER_TEST_VERBOSE"):
+        print_artifact_dir_debug(artifact_dir)
+    assert returncode == 0, f"Build failed with return code {returncode}"
+    return artifact_dir
 
-        print("\nBuild Output:")
-        print(result.stdout)
-        if result.stderr:
-            print("\nBuild Errors:")
-            print(result.stderr)
 
-        # Debug: Show contents of artifact directory
-        print("\nArtifact Directory Contents:")
-        if artifact_dir.exists():
-            print(f"Directory exists: {artifact_dir}")
-            print("Files:")
-            for item in artifact_dir.rglob("*"):
-                if item.is_file():
-                    print(
-                        f"  {item.relative_to(artifact_dir)} ({item.stat().st_size} bytes)"
-                    )
-                else:
-                    print(f"  {item.relative_to(artifact_dir)}/")
-        else:
-            print(f"Directory does not exist: {artifact_dir}")
+def mark_build_cached(artifact_dir: Path, expected_artifacts: list[str]) -> None:
+    """Mark a cached build as reusable once its artifacts have been verified.
 
-        # Debug: Check directory permissions
-        print("\nDirectory Permissions:")
-        try:
-            stat = os.stat(artifact_dir)
-            print(f"Mode: {stat.st_mode:o}")
-            print(f"Owner: {stat.st_uid}")
-            print(f"Group: {stat.st_gid}")
-        except (OSError, PermissionError) as e:
-            print(f"Error getting permissions: {e}")
-
-        assert (
-            result.returncode == 0
-        ), f"Build failed with return code {result.returncode}"
-        verify_build_artifacts(artifact_dir, expected_artifacts)
-
-        # After running the binary
-        time.sleep(1)  # Give the OS time to release file handles
-    finally:
-        # Clean up the artifacts directory after the test
-        if artifact_dir.exists():
-            try:
-                shutil.rmtree(artifact_dir, onerror=remove_readonly)
-            except (OSError, PermissionError) as e:
-                print(f"Failed to clean up {artifact_dir}: {e}")
+    A build that exits cleanly but is missing artifacts must not be reused,
+    so the marker is only written after the same checks the tests run.
+    """
+    verify_expected_artifacts(artifact_dir, expected_artifacts)
+    verify_binary_dirs(artifact_dir)
+    (artifact_dir / BUILD_CACHE_MARKER).touch()
+
+
+HOST_ARTIFACTS = (
+    LINUX_AMD64_ARTIFACTS if get_host_arch() == "amd64" else LINUX_ARM64_ARTIFACTS
+)
+
+# GitHub Actions style inputs, as defined in action.yml
+ACTION_ENV_INPUTS = {
+    "INPUT_MANIFEST": "/manifest.yaml",  # Use fixed path in container
+    "INPUT_ARTIFACT_DIR": "/artifacts",  # Use fixed path in container
+    "INPUT_OS": "linux",
+    "INPUT_ARCH": "amd64",
+}
+
+# Distributions to build: id -> (manifest, env inputs, expected artifacts).
+# "simple" sets no platform, so it defaults to the host architecture;
+# "simple_env" simulates how a customer would use the GitHub Action.
+BUILDS = {
+    "simple": ("simple.yaml", None, HOST_ARTIFACTS),
+    "simple_env": ("simple.yaml", ACTION_ENV_INPUTS, LINUX_AMD64_ARTIFACTS),
+    "contrib": ("contrib.yaml", None, HOST_ARTIFACTS),
+}
+
+
+async def build_all(
+    image_name: str, work_dirs: dict[str, Path], jobs: int
+) -> dict[str, Path | BaseException]:
+    """Run several BUILDS concurrently, at most jobs at a time.
+
+    Returns:
+        Mapping of build id to its artifact directory, or the exception
+        its build raised
+    """
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def run(build_id: str) -> Path:
+        manifest_name, env_inputs, _ = BUILDS[build_id]
+        async with semaphore:
+            return await build_distribution(
+                image_name, work_dirs[build_id], manifest_name, env_inputs=env_inputs
+            )
+
+    build_ids = list(work_dirs)
+    results = await asyncio.gather(
+        *(run(build_id) for build_id in build_ids), return_exceptions=True
+    )
+    return dict(zip(build_ids, results))
 
 
-@pytest.mark.build
-def test_simple_build() -> None:
-    """Test building a simple distribution with minimal components.
+@pytest.fixture(scope="session")
+def prebuilt_distributions(
+    request, builder_image: str, tmp_path_factory
+) -> dict[str, Path | BaseException]:
+    """Build every selected distribution concurrently from this process.
 
-    No platform is specified, so the build defaults to the host architecture.
+    The builds are independent and spend much of their time waiting on
+    Docker, the network and the Go toolchain, so they are overlapped
+    instead of run one test at a time. Under pytest-xdist, the workers
+    already parallelize the builds, so nothing is prebuilt here.
     """
-    expected = (
-        LINUX_AMD64_ARTIFACTS if get_host_arch() == "amd64" else LINUX_ARM64_ARTIFACTS
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return {}
+
+    # Only build what the selected tests (e.g. -m build) actually use
+    selected = sorted(
+        {
+            callspec.params["built_distribution"]
+            for callspec in (
+                getattr(item, "callspec", None) for item in request.session.items
+            )
+            if callspec is not None and "built_distribution" in callspec.params
+        }
     )
-    run_build_test("simple.yaml", expected)
+    if not selected:
+        return {}
+    work_dirs = {build_id: tmp_path_factory.mktemp(build_id) for build_id in selected}
+    jobs = min(len(selected), os.cpu_count() or 1)
+    return asyncio.run(build_all(builder_image, work_dirs, jobs))
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        # xdist_group keeps each build's checks on one worker under
+        # --dist loadgroup, so no distribution is built twice
+        pytest.param(
+            "simple", marks=[pytest.mark.build, pytest.mark.xdist_group("simple")]
+        ),
+        pytest.param(
+            "simple_env",
+            marks=[pytest.mark.build, pytest.mark.xdist_group("simple_env")],
+        ),
+        # Full contrib distribution with all components
+        pytest.param(
+            "contrib", marks=[pytest.mark.release, pytest.mark.xdist_group("contrib")]
+        ),
+    ],
+)
+def built_distribution(
+    request, builder_image: str, prebuilt_distributions, tmp_path_factory
+) -> tuple[Path, list[str]]:
+    """Build each distribution once and share it with the checks below.
+
+    The build is the expensive part; the checks are cheap directory scans,
+    so a failing check can be rerun and reported on its own.
+
+    Returns:
+        Tuple of (artifact directory, expected artifacts)
+    """
+    manifest_name, env_inputs, expected = BUILDS[request.param]
+    result = prebuilt_distributions.get(request.param)
+    if result is None:
+        result = asyncio.run(
+            build_distribution(
+                builder_image,
+                tmp_path_factory.mktemp(request.param),
+                manifest_name,
+                env_inputs=env_inputs,
+            )
+        )
+    if isinstance(result, BaseException):
+        raise result
+    if build_cache_enabled():
+        mark_build_cached(result, expected)
+    return result, expected
 
 
-@pytest.mark.build
-def test_simple_build_env() -> None:
-    """Test building using GitHub Actions style environment variables.
+def test_packages_built(built_distribution) -> None:
+    """Test that every expected package and archive was produced."""
+    artifact_dir, expected = built_distribution
+    packages = [a for a in expected if not a.endswith((".sbom.json", "_checksums.txt"))]
+    verify_expected_artifacts(artifact_dir, packages)
 
-    This test simulates how the GitHub Action would be used by a customer,
-    using the same environment variables defined in action.yml.
-    """
-    env_inputs = {
-        "INPUT_MANIFEST": "/manifest.yaml",  # Use fixed path in container
-        "INPUT_ARTIFACT_DIR": "/artifacts",  # Use fixed path in container
-        "INPUT_OS": "linux",
-        "INPUT_ARCH": "amd64",
-    }
-    run_build_test("simple.yaml", LINUX_AMD64_ARTIFACTS, env_inputs=env_inputs)
 
+def test_sboms_built(built_distribution) -> None:
+    """Test that each package has an SBOM."""
+    artifact_dir, expected = built_distribution
+    verify_expected_artifacts(
+        artifact_dir, [a for a in expected if a.endswith(".sbom.json")]
+    )
 
-@pytest.mark.release
-def test_contrib_build() -> None:
-    """Test building a full contrib distribution with all components."""
-    expected = (
-        LINUX_AMD64_ARTIFACTS if get_host_arch() == "amd64" else LINUX_ARM64_ARTIFACTS
+
+def test_checksums_built(built_distribution) -> None:
+    """Test that the checksums file was produced."""
+    artifact_dir, expected = built_distribution
+    verify_expected_artifacts(
+        artifact_dir, [a for a in expected if a.endswith("_checksums.txt")]
     )
-    run_build_test("contrib.yaml", expected)
+
+
+def test_binaries_built(built_distribution) -> None:
+    """Test that the raw collector binaries were produced."""
+    artifact_dir, _ = built_distribution
+    verify_binary_dirs(artifact_dir)
@@ -3,24 +3,23 @@
 import os
 
 import pytest
+import yaml
 
-from builder.src.component_registry import get_registry
 from builder.src.config_parser import (ConfigParser, ParsedComponents,
                                        parse_and_resolve, parse_config_file,
                                        resolve_components)
+from builder.src.yaml_utils import YAML_LOADER
 
 # Get the path to test configs (collector configs live under otelcol/)
 TEST_CONFIGS_DIR = os.path.join(os.path.dirname(__file__), "configs")
 TEST_OTELCOL_CONFIGS_DIR = os.path.join(TEST_CONFIGS_DIR, "otelcol")
+SIMPLE_YAML = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
+COMPLEX_YAML = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "complex.yaml")
 
-
-@pytest.mark.unit
-class TestConfigParser:
-    """Tests for ConfigParser class."""
-
-    def test_parse_simple_config(self):
-        """Test parsing a simple config with basic components."""
-        config_content = """
+# Inline collector configs. Most tests exercise the config walk rather than YAML,
+# so they use dict literals fed to ConfigParser.from_dict(). YAML text is kept only
+# for the simple config and for the from_dict/YAML parity check on connectors.
+SIMPLE_CONFIG_YAML = """
 receivers:
   otlp:
     protocols:
@@ -42,88 +41,8 @@ service:
       processors: [batch]
       exporters: [debug]
 """
-        parser = ConfigParser(config_content)
-        result = parser.parse()
-
-        assert "otlp" in result.receivers
-        assert "batch" in result.processors
-        assert "debug" in result.exporters
-
-    def test_parse_named_instances(self):
-        """Test parsing config with named instances (e.g., otlp/traces)."""
-        config_content = """
-receivers:
-  otlp/traces:
-    protocols:
-      grpc:
-        endpoint: 0.0.0.0:4317
-  otlp/metrics:
-    protocols:
-      grpc:
-        endpoint: 0.0.0.0:4318
-
-processors:
-  batch/fast:
-    timeout: 100ms
-  batch/slow:
-    timeout: 5s
-
-exporters:
-  otlp/backend1:
-    endpoint: backend1:4317
-  otlp/backend2:
-    endpoint: backend2:4317
-
-service:
-  pipelines:
-    traces:
-      receivers: [otlp/traces]
-      processors: [batch/fast]
-      exporters: [otlp/backend1]
-"""
-        parser = ConfigParser(config_content)
-        result = parser.parse()
-
-        # Should extract base names only
-        assert "otlp" in result.receivers
-        assert len([r for r in result.receivers if r == "otlp"]) == 1  # No duplicates
-        assert "batch" in result.processors
-        assert "otlp" in result.exporters
-
-    def test_parse_extensions(self):
-        """Test parsing config with extensions."""
-        config_content = """
-extensions:
-  health_check:
-    endpoint: 0.0.0.0:13133
-  pprof:
-    endpoint: 0.0.0.0:1777
-  zpages:
-    endpoint: 0.0.0.0:55679
-
-receivers:
-  otlp:
-
-exporters:
-  debug:
-
-service:
-  extensions: [health_check, pprof, zpages]
-  pipelines:
-    traces:
-      receivers: [otlp]
-      exporters: [debug]
-"""
-        parser = ConfigParser(config_content)
-        result = parser.parse()
-
-        assert "health_check" in result.extensions
-        assert "pprof" in result.extensions
-        assert "zpages" in result.extensions
 
-    def test_parse_connectors(self):
-        """Test parsing config with connectors."""
-        config_content = """
+CONNECTORS_CONFIG_YAML = """
 receivers:
   otlp:
 
@@ -150,62 +69,166 @@ service:
       receivers: [spanmetrics]
       exporters: [debug]
 """
-        parser = ConfigParser(config_content)
-        result = parser.parse()
 
-        assert "spanmetrics" in result.connectors
-        assert "forward" in result.connectors
+NAMED_INSTANCES_CONFIG = {
+    "receivers": {
+        "otlp/traces": {"protocols": {"grpc": {"endpoint": "0.0.0.0:4317"}}},
+        "otlp/metrics": {"protocols": {"grpc": {"endpoint": "0.0.0.0:4318"}}},
+    },
+    "processors": {
+        "batch/fast": {"timeout": "100ms"},
+        "batch/slow": {"timeout": "5s"},
+    },
+    "exporters": {
+        "otlp/backend1": {"endpoint": "backend1:4317"},
+        "otlp/backend2": {"endpoint": "backend2:4317"},
+    },
+    "service": {
+        "pipelines": {
+            "traces": {
+                "receivers": ["otlp/traces"],
+                "processors": ["batch/fast"],
+                "exporters": ["otlp/backend1"],
+            }
+        }
+    },
+}
+
+EXTENSIONS_CONFIG = {
+    "extensions": {
+        "health_check": {"endpoint": "0.0.0.0:13133"},
+        "pprof": {"endpoint": "0.0.0.0:1777"},
+        "zpages": {"endpoint": "0.0.0.0:55679"},
+    },
+    "receivers": {"otlp": None},
+    "exporters": {"debug": None},
+    "service": {
+        "extensions": ["health_check", "pprof", "zpages"],
+        "pipelines": {"traces": {"receivers": ["otlp"], "exporters": ["debug"]}},
+    },
+}
+
+CONNECTORS_CONFIG = {
+    "receivers": {"otlp": None},
+    "processors": {"batch": None},
+    "exporters": {"debug": None},
+    "connectors": {
+        "spanmetrics": {
+            "histogram": {"explicit": {"buckets": ["1ms", "10ms", "100ms"]}}
+        },
+        "forward": None,
+    },
+    "service": {
+        "pipelines": {
+            "traces": {
+                "receivers": ["otlp"],
+                "processors": ["batch"],
+                "exporters": ["spanmetrics", "debug"],
+            },
+            "metrics": {"receivers": ["spanmetrics"], "exporters": ["debug"]},
+        }
+    },
+}
+
+EMPTY_SECTIONS_CONFIG = {
+    "receivers": {"otlp": None},
+    "processors": {},
+    "exporters": {"debug": None},
+    "service": {
+        "pipelines": {"traces": {"receivers": ["otlp"], "exporters": ["debug"]}}
+    },
+}
+
+
+# (config, expected) pairs for TestConfigParser.test_parse. A str config goes
+# through YAML; a dict config is handed to ConfigParser.from_dict().
+PARSE_CASES = [
+    pytest.param(
+        SIMPLE_CONFIG_YAML,
+        ParsedComponents(receivers=["otlp"], processors=["batch"], exporters=["debug"]),
+        id="simple",
+    ),
+    pytest.param(
+        # Named instances collapse to unique base names
+        NAMED_INSTANCES_CONFIG,
+        ParsedComponents(receivers=["otlp"], processors=["batch"], exporters=["otlp"]),
+        id="named_instances",
+    ),
+    pytest.param(
+        EXTENSIONS_CONFIG,
+        ParsedComponents(
+            receivers=["otlp"],
+            exporters=["debug"],
+            extensions=["health_check", "pprof", "zpages"],
+        ),
+        id="extensions",
+    ),
+    pytest.param(
+        CONNECTORS_CONFIG,
+        ParsedComponents(
+            receivers=["otlp"],
+            processors=["batch"],
+            exporters=["debug"],
+            connectors=["forward", "spanmetrics"],
+        ),
+        id="connectors",
+    ),
+    pytest.param("", ParsedComponents(), id="empty"),
+    pytest.param(
+        EMPTY_SECTIONS_CONFIG,
+        ParsedComponents(receivers=["otlp"], exporters=["debug"]),
+        id="empty_sections",
+    ),
+]
 
-    def test_parse_empty_config(self):
-        """Test parsing an empty config."""
-        config_content = ""
-        parser = ConfigParser(config_content)
-        result = parser.parse()
 
-        assert result.is_empty()
+@pytest.mark.unit
+class TestConfigParser:
+    """Tests for ConfigParser class."""
 
-    def test_parse_config_with_empty_sections(self):
-        """Test parsing config with empty sections."""
-        config_content = """
-receivers:
-  otlp:
+    @pytest.mark.parametrize("config,expected", PARSE_CASES)
+    def test_parse(self, config, expected):
+        """Test the components discovered for each inline config."""
+        if isinstance(config, str):
+            parser = ConfigParser(config)
+        else:
+            parser = ConfigParser.from_dict(config)
 
-processors: {}
+        assert parser.parse() == expected
 
-exporters:
-  debug:
+    def test_from_dict_matches_yaml(self):
+        """Test that from_dict yields the same result as parsing the YAML text."""
+        from_yaml = ConfigParser(CONNECTORS_CONFIG_YAML).parse()
+        from_dict = ConfigParser.from_dict(CONNECTORS_CONFIG).parse()
 
-service:
-  pipelines:
-    traces:
-      receivers: [otlp]
-      exporters: [debug]
-"""
-        parser = ConfigParser(config_content)
-        result = parser.parse()
+        assert from_dict == from_yaml
 
-        assert "otlp" in result.receivers
-        assert len(result.processors) == 0
-        assert "debug" in result.exporters
+    def test_from_dict_validates_schema(self):
+        """Test that from_dict rejects configs with an invalid structure."""
+        with pytest.raises(ValueError, match="'receivers' must be a mapping"):
+            ConfigParser.from_dict({"receivers": ["otlp"]})
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available")
+    def test_uses_libyaml_loader(self):
+        """Test that the C-accelerated loader is used when libyaml is present."""
+        assert YAML_LOADER is yaml.CSafeLoader
 
 
 @pytest.mark.unit
 class TestParseConfigFile:
     """Tests for parse_config_file function."""
 
-    def test_parse_simple_file(self):
+    def test_parse_simple_file(self, parsed_configs):
         """Test parsing the simple test config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
-        result = parse_config_file(config_path)
+        result = parsed_configs["simple"]
 
         assert "otlp" in result.receivers
         assert "batch" in result.processors
         assert "debug" in result.exporters
 
-    def test_parse_complex_file(self):
+    def test_parse_complex_file(self, parsed_configs):
         """Test parsing the complex test config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "complex.yaml")
-        result = parse_config_file(config_path)
+        result = parsed_configs["complex"]
 
         # Check receivers
         assert "otlp" in result.receivers
@@ -231,10 +254,9 @@ class TestParseConfigFile:
         # Check connectors
         assert "spanmetrics" in result.connectors
 
-    def test_parse_named_instances_file(self):
+    def test_parse_named_instances_file(self, parsed_configs):
         """Test parsing the named instances test config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "named_instances.yaml")
-        result = parse_config_file(config_path)
+        result = parsed_configs["named_instances"]
 
         # Should only have unique base names
         assert result.receivers.count("otlp") == 1
@@ -242,10 +264,9 @@ class TestParseConfigFile:
         assert result.processors.count("batch") == 1
         assert result.exporters.count("otlp") == 1
 
-    def test_parse_minimal_file(self):
+    def test_parse_minimal_file(self, parsed_configs):
         """Test parsing the minimal test config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "minimal.yaml")
-        result = parse_config_file(config_path)
+        result = parsed_configs["minimal"]
 
         assert "nop" in result.receivers
         assert "nop" in result.exporters
@@ -255,6 +276,19 @@ class TestParseConfigFile:
         with pytest.raises(FileNotFoundError):
             parse_config_file("/nonexistent/path/config.yaml")
 
+    def test_cached_parse_tracks_file_changes(self, tmp_path):
+        """Test that a cached parse is reused until the file is modified."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(SIMPLE_CONFIG_YAML, encoding="utf-8")
+
+        first = parse_config_file(str(config_path), _cache=True)
+        assert parse_config_file(str(config_path), _cache=True) is first
+
+        config_path.write_text("receivers:\n  nop:\n", encoding="utf-8")
+        os.utime(config_path, ns=(0, os.stat(config_path).st_mtime_ns + 1))
+
+        assert parse_config_file(str(config_path), _cache=True).receivers == ["nop"]
+
 
 @pytest.mark.unit
 class TestResolveComponents:
@@ -357,8 +391,7 @@ class TestParseAndResolve:
 
     def test_parse_and_resolve_simple(self):
         """Test parsing and resolving a simple config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
-        resolved = parse_and_resolve(config_path, version="0.147.0")
+        resolved = parse_and_resolve(SIMPLE_YAML, version="0.147.0")
 
         assert len(resolved.receivers) > 0
         assert len(resolved.processors) > 0
@@ -367,8 +400,7 @@ class TestParseAndResolve:
 
     def test_parse_and_resolve_complex(self):
         """Test parsing and resolving a complex config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "complex.yaml")
-        resolved = parse_and_resolve(config_path, version="0.147.0")
+        resolved = parse_and_resolve(COMPLEX_YAML, version="0.147.0")
 
         # Should resolve all known components
         assert len(resolved.receivers) >= 4  # otlp, prometheus, filelog, hostmetrics
@@ -382,14 +414,12 @@ class TestParseAndResolve:
 class TestComponentRegistry:
     """Tests for the component registry."""
 
-    def test_registry_loads(self):
+    def test_registry_loads(self, registry):
         """Test that the registry loads successfully."""
-        registry = get_registry()
         assert registry is not None
 
-    def test_lookup_core_component(self):
+    def test_lookup_core_component(self, registry):
         """Test looking up a core component."""
-        registry = get_registry()
         info = registry.lookup("receivers", "otlp", "0.147.0")
 
         assert info is not None
@@ -397,9 +427,8 @@ class TestComponentRegistry:
         assert info.source == "core"
         assert "otlpreceiver" in info.gomod
 
-    def test_lookup_contrib_component(self):
+    def test_lookup_contrib_component(self, registry):
         """Test looking up a contrib component."""
-        registry = get_registry()
         info = registry.lookup("receivers", "prometheus", "0.147.0")
 
         assert info is not None
@@ -407,25 +436,36 @@ class TestComponentRegistry:
         assert info.source == "contrib"
         assert "prometheusreceiver" in info.gomod
 
-    def test_lookup_nonexistent(self):
+    def test_lookup_nonexistent(self, registry):
         """Test looking up a nonexistent component."""
-        registry = get_registry()
         info = registry.lookup("receivers", "nonexistent", "0.147.0")
 
         assert info is None
 
-    def test_find_similar(self):
+    def test_lookup_is_memoized(self, registry):
+        """Test that repeated lookups share one result per version."""
+        info = registry.lookup("receivers", "otlp", "0.147.0")
+
+        assert registry.lookup("receiver", "otlp/traces", "0.147.0") is info
+        assert registry.lookup("receivers", "otlp", "0.146.0") is not info
+
+    def test_lookup_many_matches_lookup(self, registry):
+        """Test that a batched lookup returns the same results, in order."""
+        names = ["otlp", "nonexistent", "prometheus/scrape"]
+        infos = registry.lookup_many("receivers", names, "0.147.0")
+
+        assert infos == [registry.lookup("receivers", n, "0.147.0") for n in names]
+        assert infos[1] is None
+
+    def test_find_similar(self, registry):
         """Test finding similar component names."""
-        registry = get_registry()
         similar = registry.find_similar("receivers", "prometheu")
 
         # Should suggest "prometheus"
         assert "prometheus" in similar
 
-    def test_lookup_handles_named_instance(self):
+    def test_lookup_handles_named_instance(self, registry):
         """Test that lookup handles named instances correctly."""
-        registry = get_registry()
-
         # Should extract base name from "otlp/traces"
         info = registry.lookup("receivers", "otlp/traces", "0.147.0")
 
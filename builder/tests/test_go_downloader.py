@@ -1,10 +1,13 @@
 """Unit tests for the Go SDK downloader module."""
 
+import io
 import os
-from unittest.mock import patch
+import tarfile
+from unittest.mock import MagicMock, patch
 
 import pytest
-from src.go_downloader import (_get_cache_dir, _get_go_arch, _get_go_os,
+from src.go_downloader import (_download_go_sdk, _extract_tar_gz,
+                               _get_cache_dir, _get_go_arch, _get_go_os,
                                build_go_url, get_cache_path)
 
 # ── URL construction ────────────────────────────────────────────────────────
@@ -133,3 +136,83 @@ def test_cache_dir_macos():
         assert result == os.path.join(
             "/Users/testuser", "Library", "Caches", "otel-distro-builder", "go"
         )
+
+
+# ── Archive extraction ─────────────────────────────────────────────────────
+
+
+class _NonSeekableStream(io.RawIOBase):
+    """Read-only stream that refuses to seek, like an HTTP response body."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._buf.readinto(b)
+
+
+@pytest.mark.unit
+def test_extract_tar_gz_from_non_seekable_stream(tmp_path):
+    """Test that a .tar.gz can be extracted directly from a network-like stream."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        data = b"#!/bin/sh\n"
+        info = tarfile.TarInfo("go/bin/go")
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+
+    _extract_tar_gz(_NonSeekableStream(buf.getvalue()), str(tmp_path))
+
+    assert (tmp_path / "go" / "bin" / "go").read_bytes() == b"#!/bin/sh\n"
+
+
+def _go_sdk_tar_gz() -> bytes:
+    """Build a minimal Go SDK .tar.gz holding go/bin/go."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+        data = b"#!/bin/sh\n"
+        info = tarfile.TarInfo("go/bin/go")
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _mock_sdk_response(raw) -> MagicMock:
+    """Build a fake streaming response usable as a context manager."""
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"content-type": "application/octet-stream"}
+    response.raw = raw
+    response.__enter__.return_value = response
+    return response
+
+
+# ── SDK download ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+def test_download_go_sdk_moves_complete_sdk_into_place(tmp_path):
+    """Test that a finished download ends up at dest/go with no staging left."""
+    response = _mock_sdk_response(_NonSeekableStream(_go_sdk_tar_gz()))
+    with patch("src.go_downloader.requests.get", return_value=response):
+        go_root = _download_go_sdk("1.24.0", "linux", "amd64", str(tmp_path))
+
+    assert go_root == str(tmp_path / "go")
+    assert (tmp_path / "go" / "bin" / "go").is_file()
+    assert os.listdir(tmp_path) == ["go"]
+    response.__exit__.assert_called_once()
+
+
+@pytest.mark.unit
+def test_download_go_sdk_interrupted_leaves_no_partial_sdk(tmp_path):
+    """Test that a truncated download leaves nothing get_go_toolchain would reuse."""
+    truncated = _go_sdk_tar_gz()[:-20]
+    response = _mock_sdk_response(_NonSeekableStream(truncated))
+    with patch("src.go_downloader.requests.get", return_value=response):
+        with pytest.raises((tarfile.TarError, EOFError, OSError)):
+            _download_go_sdk("1.24.0", "linux", "amd64", str(tmp_path))
+
+    assert not os.listdir(tmp_path)
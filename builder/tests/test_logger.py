@@ -0,0 +1,172 @@
+"""Unit tests for the logger module."""
+
+import logging
+
+import pytest
+from src.logger import BuildLogger, _use_color
+
+LOGGER_NAME = "test.build_logger"
+
+
+@pytest.fixture
+def build_logger() -> BuildLogger:
+    """Return an uncolored BuildLogger writing to LOGGER_NAME."""
+    return BuildLogger(logging.getLogger(LOGGER_NAME), color=False)
+
+
+class _FakeStream:
+    """Stream stand-in whose isatty() answer is fixed."""
+
+    def __init__(self, tty: bool):
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+# ── color detection ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "env,tty,expected",
+    [
+        ({}, True, True),
+        ({}, False, False),
+        ({"NO_COLOR": "1"}, True, False),
+        ({"FORCE_COLOR": "1"}, False, True),
+        # NO_COLOR wins when both are set
+        ({"NO_COLOR": "1", "FORCE_COLOR": "1"}, True, False),
+        # Empty values count as unset
+        ({"NO_COLOR": ""}, True, True),
+        ({"FORCE_COLOR": ""}, False, False),
+    ],
+)
+def test_use_color(monkeypatch, env, tty, expected):
+    """Test color detection from NO_COLOR, FORCE_COLOR and the stream."""
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    assert _use_color(_FakeStream(tty)) is expected
+
+
+@pytest.mark.unit
+def test_use_color_stream_without_isatty(monkeypatch):
+    """Test that a stream lacking isatty() is treated as not a terminal."""
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    assert _use_color(object()) is False
+
+
+@pytest.mark.unit
+def test_uncolored_logger_emits_no_ansi_codes(build_logger, caplog):
+    """Test that color=False output carries no escape sequences."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        build_logger.section("Title")
+        build_logger.success("done")
+
+    assert all("\033[" not in r.getMessage() for r in caplog.records)
+
+
+# ── buffered ────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+def test_buffered_flushes_one_record_in_order(build_logger, caplog):
+    """Test that buffered messages are emitted together, in call order."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        with build_logger.buffered() as log:
+            log.info("first")
+            log.success("second")
+            log.info("third", indent=1)
+            assert not caplog.records
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage() == "first\n✓ second\n  third"
+    assert caplog.records[0].levelno == logging.INFO
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "method,expected_level",
+    [
+        ("warning", logging.WARNING),
+        ("error", logging.ERROR),
+    ],
+)
+def test_buffered_uses_highest_level(build_logger, caplog, method, expected_level):
+    """Test that a buffered warning or error escalates the whole record."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        with build_logger.buffered() as log:
+            log.info("before")
+            getattr(log, method)("problem")
+            log.info("after")
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelno == expected_level
+
+
+@pytest.mark.unit
+def test_buffered_flushes_on_exception(build_logger, caplog):
+    """Test that messages logged before an exception are still emitted."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        with pytest.raises(RuntimeError):
+            with build_logger.buffered() as log:
+                log.info("started")
+                raise RuntimeError("boom")
+
+    assert [r.getMessage() for r in caplog.records] == ["started"]
+
+
+@pytest.mark.unit
+def test_buffered_without_messages_emits_nothing(build_logger, caplog):
+    """Test that an empty buffered block emits no record."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        with build_logger.buffered():
+            pass
+
+    assert not caplog.records
+
+
+# ── message format ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "msg,indent,expected",
+    [
+        ("single", 0, "single"),
+        ("single", 2, "    single"),
+        # Every line is indented, including blank ones
+        ("first\nsecond", 1, "  first\n  second"),
+        ("first\n\nthird", 2, "    first\n    \n    third"),
+        ("first\nsecond", 0, "first\nsecond"),
+    ],
+)
+def test_info_indents_every_line(build_logger, caplog, msg, indent, expected):
+    """Test that info() emits one record with each line indented."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        build_logger.info(msg, indent=indent)
+
+    assert [r.getMessage() for r in caplog.records] == [expected]
+
+
+@pytest.mark.unit
+def test_command_without_output(build_logger, caplog):
+    """Test that a command on its own is one prefixed line."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        build_logger.command("go build ./...")
+
+    assert [r.getMessage() for r in caplog.records] == ["$ go build ./..."]
+
+
+@pytest.mark.unit
+def test_command_with_output(build_logger, caplog):
+    """Test that a command and its output are one record, output indented."""
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        build_logger.command("go version", output="go1.24.0\nlinux/amd64\n")
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "$ go version\n  go1.24.0\n  linux/amd64"
+    ]
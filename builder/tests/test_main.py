@@ -1,11 +1,34 @@
 """Tests for the main module."""
 
+import io
 import os
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from src.main import _get_version, main
 
+MANIFEST_CONTENT = """
+    dist:
+      name: test-collector
+      description: Test OpenTelemetry Collector distribution
+      version: 0.1.0
+    
+    exporters:
+      - gomod: github.com/open-telemetry/opentelemetry-collector-contrib/exporter/fileexporter v0.122.0
+    """
+
+
+def _fake_open(*_args, **_kwargs):
+    """Stand-in for open() that reads back MANIFEST_CONTENT."""
+    return io.StringIO(MANIFEST_CONTENT)
+
+
+class _NullLogger:
+    """Logger stand-in whose methods all do nothing."""
+
+    def __getattr__(self, _name):
+        return lambda *_args, **_kwargs: None
+
 
 @pytest.mark.unit
 @pytest.mark.parametrize(
@@ -59,49 +82,38 @@ from src.main import _get_version, main
         ),
     ],
 )
-def test_main_argument_handling(args, expected_goos, expected_goarch, expected_pairs):
+def test_main_argument_handling(
+    monkeypatch, args, expected_goos, expected_goarch, expected_pairs
+):
     """Test main function argument handling."""
-    manifest_content = """
-    dist:
-      name: test-collector
-      description: Test OpenTelemetry Collector distribution
-      version: 0.1.0
-    
-    exporters:
-      - gomod: github.com/open-telemetry/opentelemetry-collector-contrib/exporter/fileexporter v0.122.0
-    """
-
-    with (
-        patch("builtins.open", mock_open(read_data=manifest_content)),
-        patch("src.main.build.build") as mock_build,
-        patch("sys.argv", ["main.py"] + args),
-        patch("os.makedirs"),
-        patch("src.main.logger"),
-        patch("src.platforms.get_host_platform", return_value=("linux", "amd64")),
-        patch("os.getcwd", return_value="/tmp"),
-    ):
-
-        mock_build.return_value = True
-
-        # Expect SystemExit(0) for success
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-        assert exc_info.value.code == 0
-
-        # Verify build called with expected arguments (artifact_dir = host default)
-        mock_build.assert_called_once_with(
-            manifest_content=manifest_content,
-            artifact_dir="/tmp/artifacts",
-            goos=expected_goos,
-            goarch=expected_goarch,
-            platform_pairs=expected_pairs,
-            ocb_version=None,
-            supervisor_version=None,
-            go_version=None,
-            parallelism=4,
-            keep_build_dir=False,
-            manifest_source_dir=os.path.dirname(os.path.abspath("test.yaml")),
-        )
+    mock_build = MagicMock(return_value=True)
+    monkeypatch.setattr("builtins.open", _fake_open)
+    monkeypatch.setattr("src.main.build.build", mock_build)
+    monkeypatch.setattr("sys.argv", ["main.py"] + args)
+    monkeypatch.setattr("os.makedirs", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("src.main.logger", _NullLogger())
+    monkeypatch.setattr("src.platforms.get_host_platform", lambda: ("linux", "amd64"))
+    monkeypatch.setattr("os.getcwd", lambda: "/tmp")
+
+    # Expect SystemExit(0) for success
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 0
+
+    # Verify build called with expected arguments (artifact_dir = host default)
+    mock_build.assert_called_once_with(
+        manifest_content=MANIFEST_CONTENT,
+        artifact_dir="/tmp/artifacts",
+        goos=expected_goos,
+        goarch=expected_goarch,
+        platform_pairs=expected_pairs,
+        ocb_version=None,
+        supervisor_version=None,
+        go_version=None,
+        parallelism=4,
+        keep_build_dir=False,
+        manifest_source_dir=os.path.dirname(os.path.abspath("test.yaml")),
+    )
 
 
 @pytest.mark.unit
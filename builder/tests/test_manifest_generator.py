@@ -1,27 +1,56 @@
 """Tests for the manifest generator module."""
 
+import dataclasses
 import os
-import tempfile
+import re
 
 import pytest
-import yaml
 
 from builder.src.config_parser import ParsedComponents, resolve_components
 from builder.src.manifest_generator import (ManifestConfig, ManifestGenerator,
                                             generate_manifest,
                                             generate_manifest_from_config)
 from builder.src.resources import get_bindplane_components_yaml_path
+from builder.src.yaml_utils import load_yaml
 
 # Get the path to test configs (collector configs live under otelcol/)
 TEST_CONFIGS_DIR = os.path.join(os.path.dirname(__file__), "configs")
+TEST_OTELCOL_CONFIGS_DIR = os.path.join(TEST_CONFIGS_DIR, "otelcol")
+SIMPLE_CONFIG_PATH = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
+COMPLEX_CONFIG_PATH = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "complex.yaml")
+
+# Shared manifest configs; ManifestConfig is frozen, so tests can't alter them
+BINDPLANE_CONFIG = ManifestConfig(include_bindplane=True)
+NO_BINDPLANE_CONFIG = ManifestConfig(include_bindplane=False)
+NO_PROVIDERS_CONFIG = ManifestConfig(include_providers=False)
+NO_REPLACES_CONFIG = ManifestConfig(include_replaces=False)
 
 
 def _get_bindplane_version() -> str:
     """Read the current Bindplane version from bindplane_components.yaml."""
     with open(get_bindplane_components_yaml_path(), "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
     return data["version"]
-TEST_OTELCOL_CONFIGS_DIR = os.path.join(TEST_CONFIGS_DIR, "otelcol")
+
+
+def _has_top_level_key(content: str, key: str) -> bool:
+    """Check for a top-level key in generated manifest YAML without parsing it."""
+    return re.search(rf"^{re.escape(key)}:", content, re.MULTILINE) is not None
+
+
+@pytest.fixture(scope="module")
+def simple_result():
+    """Manifest generated from simple.yaml with default options, built once."""
+    return generate_manifest_from_config(
+        config_path=SIMPLE_CONFIG_PATH,
+        otel_version="0.147.0",
+    )
+
+
+@pytest.fixture(scope="module")
+def simple_manifest(simple_result):
+    """The simple_result manifest parsed back into a dict."""
+    return load_yaml(simple_result.content)
 
 
 @pytest.mark.unit
@@ -37,12 +66,12 @@ class TestManifestGenerator:
         )
         resolved = resolve_components(parsed, version="0.147.0")
 
-        config = ManifestConfig(include_bindplane=False)
+        config = NO_BINDPLANE_CONFIG
         generator = ManifestGenerator(resolved, config)
         result = generator.generate()
 
         # Parse the generated YAML
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # Check dist section
         assert "dist" in manifest
@@ -57,14 +86,8 @@ class TestManifestGenerator:
         assert len(manifest["receivers"]) == 1
         assert "gomod" in manifest["receivers"][0]
 
-    def test_generate_with_custom_config(self):
+    def test_generate_with_custom_config(self, resolved_otlp_debug):
         """Test generating a manifest with custom configuration."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
         config = ManifestConfig(
             module="github.com/myorg/mycollector",
             name="mycollector",
@@ -73,46 +96,36 @@ class TestManifestGenerator:
             otel_version="0.147.0",
         )
 
-        generator = ManifestGenerator(resolved, config)
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert manifest["dist"]["module"] == "github.com/myorg/mycollector"
         assert manifest["dist"]["name"] == "mycollector"
         assert manifest["dist"]["description"] == "My custom collector"
         assert manifest["dist"]["version"] == "2.0.0"
 
-    def test_generate_includes_providers(self):
+    def test_generate_includes_providers(self, resolved_otlp_debug):
         """Test that generated manifest includes providers."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        generator = ManifestGenerator(resolved)
+        generator = ManifestGenerator(resolved_otlp_debug)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert "providers" in manifest
+        assert _has_top_level_key(result.content, "providers")
         assert len(manifest["providers"]) >= 5  # env, file, http, https, yaml
 
-    def test_generate_includes_replaces(self):
+    def test_generate_includes_replaces(self, resolved_otlp_debug):
         """Test that generated manifest includes replaces."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        generator = ManifestGenerator(resolved)
+        generator = ManifestGenerator(resolved_otlp_debug)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert "replaces" in manifest
+        assert _has_top_level_key(result.content, "replaces")
         assert len(manifest["replaces"]) >= 1
 
     def test_generate_with_extensions(self):
@@ -124,11 +137,11 @@ class TestManifestGenerator:
         )
         resolved = resolve_components(parsed, version="0.147.0")
 
-        config = ManifestConfig(include_bindplane=False)
+        config = NO_BINDPLANE_CONFIG
         generator = ManifestGenerator(resolved, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert "extensions" in manifest
         assert len(manifest["extensions"]) == 3
@@ -142,11 +155,11 @@ class TestManifestGenerator:
         )
         resolved = resolve_components(parsed, version="0.147.0")
 
-        config = ManifestConfig(include_bindplane=False)
+        config = NO_BINDPLANE_CONFIG
         generator = ManifestGenerator(resolved, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert "connectors" in manifest
         assert len(manifest["connectors"]) == 2
@@ -165,39 +178,28 @@ class TestManifestGenerator:
         assert len(result.warnings) > 0
         assert any("unknown_receiver" in w for w in result.warnings)
 
-    def test_generate_without_providers(self):
-        """Test generating a manifest without providers."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
+    def test_manifest_config_is_immutable(self):
+        """Test that shared ManifestConfig instances can't be modified."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            NO_PROVIDERS_CONFIG.include_providers = True  # type: ignore[misc]
 
-        config = ManifestConfig(include_providers=False)
+    def test_generate_without_providers(self, resolved_otlp_debug):
+        """Test generating a manifest without providers."""
+        config = NO_PROVIDERS_CONFIG
 
-        generator = ManifestGenerator(resolved, config)
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
-
-        assert "providers" not in manifest
+        assert not _has_top_level_key(result.content, "providers")
 
-    def test_generate_without_replaces(self):
+    def test_generate_without_replaces(self, resolved_otlp_debug):
         """Test generating a manifest without replaces."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        config = ManifestConfig(include_replaces=False)
+        config = NO_REPLACES_CONFIG
 
-        generator = ManifestGenerator(resolved, config)
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
-
-        assert "replaces" not in manifest
+        assert not _has_top_level_key(result.content, "replaces")
 
 
 @pytest.mark.unit
@@ -221,7 +223,7 @@ class TestGenerateManifest:
             include_bindplane=False,
         )
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert manifest["dist"]["name"] == "test-collector"
         assert len(manifest["receivers"]) == 2
@@ -235,7 +237,7 @@ class TestGenerateManifestFromConfig:
 
     def test_generate_from_simple_config(self):
         """Test generating manifest from simple config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
+        config_path = SIMPLE_CONFIG_PATH
 
         result = generate_manifest_from_config(
             config_path=config_path,
@@ -243,7 +245,7 @@ class TestGenerateManifestFromConfig:
             otel_version="0.147.0",
         )
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert manifest["dist"]["name"] == "simple-collector"
         assert "receivers" in manifest
@@ -252,7 +254,7 @@ class TestGenerateManifestFromConfig:
 
     def test_generate_from_complex_config(self):
         """Test generating manifest from complex config file."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "complex.yaml")
+        config_path = COMPLEX_CONFIG_PATH
 
         result = generate_manifest_from_config(
             config_path=config_path,
@@ -260,68 +262,47 @@ class TestGenerateManifestFromConfig:
             otel_version="0.147.0",
         )
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert manifest["dist"]["name"] == "complex-collector"
         assert len(manifest["receivers"]) >= 4
         assert len(manifest["extensions"]) >= 3
         assert len(manifest["connectors"]) >= 1
 
-    def test_generate_writes_to_file(self):
+    def test_generate_writes_to_file(self, tmp_path):
         """Test that manifest is written to file when output_path specified."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "manifest.yaml")
-
-            result = generate_manifest_from_config(
-                config_path=config_path,
-                output_path=output_path,
-                name="test-collector",
-                otel_version="0.147.0",
-            )
-
-            # Check file was written
-            assert os.path.exists(output_path)
-
-            # Read and verify content
-            with open(output_path, "r") as f:
-                file_content = f.read()
-
-            assert file_content == result.content
-
-    def test_generate_header_comment(self):
-        """Test that generated manifest has header comment."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
+        config_path = SIMPLE_CONFIG_PATH
+        output_path = tmp_path / "manifest.yaml"
 
         result = generate_manifest_from_config(
             config_path=config_path,
+            output_path=str(output_path),
+            name="test-collector",
             otel_version="0.147.0",
         )
 
+        # The written file holds exactly the returned content
+        assert output_path.read_text(encoding="utf-8") == result.content
+
+    def test_generate_header_comment(self, simple_result):
+        """Test that generated manifest has header comment."""
         # Should have header comments
-        assert result.content.startswith("#")
-        assert "Generated from collector config.yaml" in result.content
-        assert "0.147.0" in result.content
+        assert simple_result.content.startswith("#")
+        assert "Generated from collector config.yaml" in simple_result.content
+        assert "0.147.0" in simple_result.content
 
 
 @pytest.mark.unit
 class TestBindplaneComponents:
     """Tests for Bindplane component inclusion."""
 
-    def test_bindplane_components_included_by_default(self):
+    def test_bindplane_components_included_by_default(self, resolved_otlp_debug):
         """Test that Bindplane components are included by default."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
         # Default config includes Bindplane
-        generator = ManifestGenerator(resolved)
+        generator = ManifestGenerator(resolved_otlp_debug)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # Should have more receivers than just otlp (Bindplane adds 3)
         assert len(manifest["receivers"]) > 1
@@ -330,19 +311,13 @@ class TestBindplaneComponents:
         gomods = [r["gomod"] for r in manifest["receivers"]]
         assert any("filelogreceiver" in g for g in gomods)
 
-    def test_bindplane_components_excluded_with_flag(self):
+    def test_bindplane_components_excluded_with_flag(self, resolved_otlp_debug):
         """Test that Bindplane components can be excluded."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        config = ManifestConfig(include_bindplane=False)
-        generator = ManifestGenerator(resolved, config)
+        config = NO_BINDPLANE_CONFIG
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # Should have only the user's receiver
         assert len(manifest["receivers"]) == 1
@@ -351,44 +326,30 @@ class TestBindplaneComponents:
         gomods = [r["gomod"] for r in manifest["receivers"]]
         assert not any("observiq" in g for g in gomods)
 
-    def test_bindplane_replaces_included(self):
+    def test_bindplane_replaces_included(self, resolved_otlp_debug):
         """Test that Bindplane replaces are included when enabled."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        generator = ManifestGenerator(resolved)
+        generator = ManifestGenerator(resolved_otlp_debug)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
-
         # Should have Bindplane replaces
-        replaces_str = " ".join(manifest.get("replaces", []))
-        assert "observiq" in replaces_str
+        assert _has_top_level_key(result.content, "replaces")
+        assert any("observiq" in r for r in result.yaml_dict["replaces"])
 
 
 @pytest.mark.unit
 class TestBindplaneVersion:
     """Tests for --bindplane-version override."""
 
-    def test_bindplane_version_override(self):
+    def test_bindplane_version_override(self, resolved_otlp_debug):
         """Test that bindplane_version overrides the file's default."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
         config = ManifestConfig(
             include_bindplane=True,
             bindplane_version="1.90.0",
         )
-        generator = ManifestGenerator(resolved, config)
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # All Bindplane-owned gomods should use v1.90.0
         all_gomods = []
@@ -401,19 +362,13 @@ class TestBindplaneVersion:
         for gomod in bp_gomods:
             assert "v1.90.0" in gomod, f"Expected v1.90.0 in {gomod}"
 
-    def test_bindplane_version_default_uses_file(self):
+    def test_bindplane_version_default_uses_file(self, resolved_otlp_debug):
         """Test that without override, the file's version is used."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        config = ManifestConfig(include_bindplane=True)
-        generator = ManifestGenerator(resolved, config)
+        config = BINDPLANE_CONFIG
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
 
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # Check that Bindplane gomods use the version from the file
         expected_version = _get_bindplane_version()
@@ -470,18 +425,12 @@ class TestRequiredBindplaneCompatibility:
             if "gomod" in entry
         }
 
-    def test_minimal_config_includes_all_required_modules(self):
+    def test_minimal_config_includes_all_required_modules(self, resolved_otlp_debug):
         """With include_bindplane=True, even a minimal config produces all required modules."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        config = ManifestConfig(include_bindplane=True)
-        generator = ManifestGenerator(resolved, config)
+        config = BINDPLANE_CONFIG
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         conn_paths = self._gomod_paths(manifest, "connectors")
         for req in self.REQUIRED_CONNECTORS:
@@ -503,18 +452,12 @@ class TestRequiredBindplaneCompatibility:
         for req in self.REQUIRED_RECEIVERS:
             assert req in recv_paths, f"Missing required receiver: {req}"
 
-    def test_required_modules_not_added_when_bindplane_disabled(self):
+    def test_required_modules_not_added_when_bindplane_disabled(self, resolved_otlp_debug):
         """With include_bindplane=False, no required modules are added."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        config = ManifestConfig(include_bindplane=False)
-        generator = ManifestGenerator(resolved, config)
+        config = NO_BINDPLANE_CONFIG
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # Should NOT have connectors section at all (user didn't specify any)
         assert "connectors" not in manifest
@@ -536,10 +479,10 @@ class TestRequiredBindplaneCompatibility:
         )
         resolved = resolve_components(parsed, version="0.147.0")
 
-        config = ManifestConfig(include_bindplane=True)
+        config = BINDPLANE_CONFIG
         generator = ManifestGenerator(resolved, config)
         result = generator.generate()
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         # forwardconnector should appear exactly once
         conn_gomods = [e["gomod"] for e in manifest.get("connectors", [])]
@@ -553,18 +496,12 @@ class TestRequiredBindplaneCompatibility:
         )
         assert otlp_count == 1, f"otlpexporter appeared {otlp_count} times"
 
-    def test_connectors_section_created_when_absent(self):
+    def test_connectors_section_created_when_absent(self, resolved_otlp_debug):
         """When user config has no connectors, the required connectors still appear."""
-        parsed = ParsedComponents(
-            receivers=["otlp"],
-            exporters=["debug"],
-        )
-        resolved = resolve_components(parsed, version="0.147.0")
-
-        config = ManifestConfig(include_bindplane=True)
-        generator = ManifestGenerator(resolved, config)
+        config = BINDPLANE_CONFIG
+        generator = ManifestGenerator(resolved_otlp_debug, config)
         result = generator.generate()
-        manifest = yaml.safe_load(result.content)
+        manifest = result.yaml_dict
 
         assert "connectors" in manifest
         conn_paths = self._gomod_paths(manifest, "connectors")
@@ -576,21 +513,12 @@ class TestRequiredBindplaneCompatibility:
 class TestManifestValidity:
     """Tests to ensure generated manifests are valid for OCB."""
 
-    def test_manifest_has_required_sections(self):
+    def test_manifest_has_required_sections(self, simple_manifest):
         """Test that manifest has all required sections for OCB."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
-
-        result = generate_manifest_from_config(
-            config_path=config_path,
-            otel_version="0.147.0",
-        )
-
-        manifest = yaml.safe_load(result.content)
-
         # Required sections
-        assert "dist" in manifest
-        assert "module" in manifest["dist"]
-        assert "name" in manifest["dist"]
+        assert "dist" in simple_manifest
+        assert "module" in simple_manifest["dist"]
+        assert "name" in simple_manifest["dist"]
 
         # At least one component type should be present
         component_types = [
@@ -600,37 +528,23 @@ class TestManifestValidity:
             "extensions",
             "connectors",
         ]
-        has_components = any(t in manifest for t in component_types)
+        has_components = any(t in simple_manifest for t in component_types)
         assert has_components
 
-    def test_gomod_format_is_correct(self):
+    def test_gomod_format_is_correct(self, simple_manifest):
         """Test that gomod entries have correct format."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
-
-        result = generate_manifest_from_config(
-            config_path=config_path,
-            otel_version="0.147.0",
-        )
-
-        manifest = yaml.safe_load(result.content)
-
-        for receiver in manifest.get("receivers", []):
+        for receiver in simple_manifest.get("receivers", []):
             gomod = receiver["gomod"]
             # Should have module path and version
             parts = gomod.split()
             assert len(parts) >= 2, f"Invalid gomod format: {gomod}"
             assert parts[1].startswith("v"), f"Version should start with v: {gomod}"
 
-    def test_conf_resolver_present(self):
+    def test_conf_resolver_present(self, simple_manifest):
         """Test that conf_resolver section is present."""
-        config_path = os.path.join(TEST_OTELCOL_CONFIGS_DIR, "simple.yaml")
-
-        result = generate_manifest_from_config(
-            config_path=config_path,
-            otel_version="0.147.0",
-        )
-
-        manifest = yaml.safe_load(result.content)
+        assert "conf_resolver" in simple_manifest
+        assert "default_uri_scheme" in simple_manifest["conf_resolver"]
 
-        assert "conf_resolver" in manifest
-        assert "default_uri_scheme" in manifest["conf_resolver"]
+    def test_content_round_trips_to_yaml_dict(self, simple_result, simple_manifest):
+        """Test that the rendered YAML parses back to the returned yaml_dict."""
+        assert simple_manifest == simple_result.yaml_dict
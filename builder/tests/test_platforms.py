@@ -5,7 +5,7 @@ from unittest.mock import patch
 import pytest
 from src.platforms import (get_host_platform, parse_platform_pairs,
                            parse_platforms, resolve_platform_pairs,
-                           resolve_platforms)
+                           resolve_platforms, split_comma_list)
 
 # All tests that depend on default platform behavior mock get_host_platform
 # to return ("linux", "amd64") so tests are deterministic on any machine.
@@ -98,6 +98,35 @@ def test_parse_platforms(platforms, expected):
     assert parse_platforms(platforms) == expected
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("linux", ["linux"]),
+        ("linux,darwin", ["linux", "darwin"]),
+        ("linux, darwin", ["linux", "darwin"]),
+        ("linux,,darwin,", ["linux", "darwin"]),  # Skip empty items
+        ("", []),
+    ],
+)
+def test_split_comma_list(value, expected):
+    """Test splitting of --goos/--goarch values."""
+    assert split_comma_list(value) == expected
+
+
+@pytest.mark.unit
+def test_resolve_platforms_accepts_lists():
+    """Test that pre-split goos/goarch lists resolve like their strings."""
+    with patch("src.platforms.get_host_platform", return_value=MOCK_HOST):
+        assert resolve_platforms(goos=["windows", "darwin"], goarch=[]) == (
+            ["windows", "darwin"],
+            ["amd64"],
+        )
+        assert resolve_platform_pairs(goos=["windows"], goarch=["arm64"]) == [
+            ("windows", "arm64")
+        ]
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "platforms,goos,goarch,expected_goos,expected_goarch",
@@ -0,0 +1,154 @@
+"""Unit tests for the OpAMP Supervisor downloader module."""
+
+import os
+import stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.supervisor_downloader import (ETAG_CACHE_FILE, download_file,
+                                       download_supervisor)
+
+
+def _mock_response(status_code=200, chunks=(b"binary",), headers=None):
+    """Build a fake streaming response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+# ── download_file ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+def test_download_file_writes_content(tmp_path):
+    """Test that a successful download lands at the output path."""
+    output_file = tmp_path / "supervisor_linux_amd64"
+    with patch(
+        "src.supervisor_downloader.requests.get",
+        return_value=_mock_response(chunks=(b"abc", b"", b"def")),
+    ):
+        download_file("https://example.com/supervisor", str(output_file))
+
+    assert output_file.read_bytes() == b"abcdef"
+    assert list(tmp_path.iterdir()) == [output_file]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_download_file_is_world_readable(tmp_path):
+    """Test that the downloaded file doesn't keep the temp file's 0600 mode."""
+    output_file = tmp_path / "supervisor_windows_amd64.exe"
+    with patch(
+        "src.supervisor_downloader.requests.get", return_value=_mock_response()
+    ):
+        download_file("https://example.com/supervisor", str(output_file))
+
+    assert stat.S_IMODE(output_file.stat().st_mode) == 0o644
+
+
+@pytest.mark.unit
+def test_download_file_interrupted_leaves_no_partial_file(tmp_path):
+    """Test that an interrupted download leaves neither output nor temp files."""
+
+    def broken_stream(**_kwargs):
+        yield b"partial"
+        raise ConnectionError("connection reset")
+
+    response = _mock_response()
+    response.iter_content.side_effect = broken_stream
+    output_file = tmp_path / "supervisor_linux_amd64"
+
+    with patch("src.supervisor_downloader.requests.get", return_value=response):
+        with pytest.raises(ConnectionError):
+            download_file("https://example.com/supervisor", str(output_file))
+
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.unit
+def test_download_file_preserves_existing_file_on_failure(tmp_path):
+    """Test that a failed re-download does not clobber a previous good file."""
+    output_file = tmp_path / "supervisor_linux_amd64"
+    output_file.write_bytes(b"good")
+
+    response = _mock_response()
+    response.iter_content.side_effect = ConnectionError("connection reset")
+
+    with patch("src.supervisor_downloader.requests.get", return_value=response):
+        with pytest.raises(ConnectionError):
+            download_file("https://example.com/supervisor", str(output_file))
+
+    assert output_file.read_bytes() == b"good"
+
+
+@pytest.mark.unit
+def test_download_file_returns_etag(tmp_path):
+    """Test that the response ETag is returned after a fresh download."""
+    output_file = tmp_path / "supervisor_linux_amd64"
+    with patch(
+        "src.supervisor_downloader.requests.get",
+        return_value=_mock_response(headers={"ETag": '"abc"'}),
+    ) as mock_get:
+        etag = download_file("https://example.com/supervisor", str(output_file))
+
+    assert etag == '"abc"'
+    assert mock_get.call_args.kwargs["headers"] == {}
+
+
+@pytest.mark.unit
+def test_download_file_not_modified_keeps_file(tmp_path):
+    """Test that a 304 response leaves the existing file untouched."""
+    output_file = tmp_path / "supervisor_linux_amd64"
+    output_file.write_bytes(b"cached")
+
+    with patch(
+        "src.supervisor_downloader.requests.get",
+        return_value=_mock_response(status_code=304),
+    ) as mock_get:
+        etag = download_file(
+            "https://example.com/supervisor", str(output_file), etag='"abc"'
+        )
+
+    assert etag == '"abc"'
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    assert output_file.read_bytes() == b"cached"
+
+
+@pytest.mark.unit
+def test_download_file_ignores_etag_without_file(tmp_path):
+    """Test that a cached ETag is not sent when the file has gone missing."""
+    output_file = tmp_path / "supervisor_linux_amd64"
+    with patch(
+        "src.supervisor_downloader.requests.get",
+        return_value=_mock_response(),
+    ) as mock_get:
+        download_file("https://example.com/supervisor", str(output_file), etag='"a"')
+
+    assert mock_get.call_args.kwargs["headers"] == {}
+    assert output_file.read_bytes() == b"binary"
+
+
+# ── download_supervisor ─────────────────────────────────────────────────────
+
+
+@pytest.mark.unit
+def test_download_supervisor_reuses_etag_cache(tmp_path):
+    """Test that a second run sends the ETags recorded by the first run."""
+    with patch(
+        "src.supervisor_downloader.requests.get",
+        side_effect=lambda *a, **kw: _mock_response(headers={"ETag": '"v1"'}),
+    ):
+        download_supervisor(str(tmp_path), "0.147.0", platforms=[("linux", "amd64")])
+
+    assert (tmp_path / ETAG_CACHE_FILE).is_file()
+
+    with patch(
+        "src.supervisor_downloader.requests.get",
+        return_value=_mock_response(status_code=304),
+    ) as mock_get:
+        download_supervisor(str(tmp_path), "0.147.0", platforms=[("linux", "amd64")])
+
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert (tmp_path / "supervisor_linux_amd64").read_bytes() == b"binary"
@@ -2,9 +2,11 @@
 
 import pytest
 import yaml
-from src.version import (MIN_SUPERVISOR_VERSION, BuildVersions,
-                         determine_build_versions,
+from src.resources import get_versions_yaml_path
+from src.version import (DEFAULT_VERSION, MIN_SUPERVISOR_VERSION,
+                         BuildVersions, determine_build_versions,
                          get_contrib_version_from_manifest)
+from src.yaml_utils import load_yaml
 
 
 @pytest.mark.unit
@@ -104,9 +106,40 @@ processors:
         get_contrib_version_from_manifest(manifest)
 
 
+@pytest.mark.unit
+def test_parse_flow_style_manifest():
+    """Test that manifests not written in block style are still parsed."""
+    manifest = """
+dist: {name: test}
+exporters: [{gomod: "github.com/open-telemetry/opentelemetry-collector-contrib/exporter/fileexporter v0.121.0"}]
+"""
+    version = get_contrib_version_from_manifest(manifest)
+    assert version == "0.121.0"
+
+
+@pytest.mark.unit
+def test_parse_manifest_with_inline_comments():
+    """Test that gomod lines with a trailing comment are not skipped."""
+    manifest = """
+receivers:
+  - gomod: github.com/open-telemetry/opentelemetry-collector-contrib/receiver/areceiver v0.120.0
+  - gomod: github.com/open-telemetry/opentelemetry-collector-contrib/receiver/breceiver v0.122.0 # pinned
+"""
+    version = get_contrib_version_from_manifest(manifest)
+    assert version == "0.122.0"
+
+
 @pytest.mark.unit
 def test_parse_invalid_manifest():
     """Test parsing version from an invalid manifest."""
     manifest = "invalid: yaml: content"
     with pytest.raises(yaml.YAMLError):
         get_contrib_version_from_manifest(manifest)
+
+
+@pytest.mark.unit
+def test_default_version_is_first_versions_key():
+    """DEFAULT_VERSION matches the first key of a full versions.yaml parse."""
+    with open(get_versions_yaml_path(), "r", encoding="utf-8") as f:
+        versions = load_yaml(f)["versions"]
+    assert DEFAULT_VERSION == str(next(iter(versions)))
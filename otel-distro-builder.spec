@@ -38,6 +38,8 @@ a = Analysis(
         'builder.src.goreleaser_downloader',
         'builder.src.ocb_downloader',
         'builder.src.supervisor_downloader',
+        'builder.src.yaml_utils',
+        'builder.src.compat',
     ],
     hookspath=[],
     hooksconfig={},